@@ -0,0 +1,51 @@
+"""Add resources table for harvested upstream results
+
+Revision ID: 5b8d2e61f0a4
+Revises: e4f2a7c9d813
+Create Date: 2026-10-18 13:41:52.218304
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b8d2e61f0a4'
+down_revision: Union[str, None] = 'e4f2a7c9d813'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('resources',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('url', sa.String(), nullable=False),
+    sa.Column('resource_type', sa.String(), nullable=False),
+    sa.Column('title', sa.String(), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('data', sa.JSON(), nullable=False),
+    sa.Column('harvested_at', sa.TIMESTAMP(), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('url')
+    )
+    op.create_index(op.f('ix_resources_id'), 'resources', ['id'], unique=False)
+    op.create_index('ix_resources_resource_type_id', 'resources', ['resource_type', 'id'], unique=False)
+
+    # Same weighting as community uploads and bookmarks: title above description
+    op.execute(
+        "ALTER TABLE resources ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ("
+        "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(description, '')), 'B')) STORED"
+    )
+    op.create_index('ix_resources_search_vector', 'resources', ['search_vector'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_resources_search_vector', table_name='resources', postgresql_using='gin')
+    op.drop_index('ix_resources_resource_type_id', table_name='resources')
+    op.drop_index(op.f('ix_resources_id'), table_name='resources')
+    op.drop_table('resources')
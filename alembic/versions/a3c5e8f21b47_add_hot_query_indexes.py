@@ -0,0 +1,48 @@
+"""Add composite and partial indexes for hot query shapes
+
+Revision ID: a3c5e8f21b47
+Revises: 65de94252810
+Create Date: 2026-10-18 10:12:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3c5e8f21b47'
+down_revision: Union[str, None] = '65de94252810'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+PENDING_FILTER = sa.text("status = 'pending_approval'")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY can't run inside a transaction, and avoids locking the tables against writes
+    with op.get_context().autocommit_block():
+        # bookmarks WHERE user_id = ? ORDER BY id
+        op.create_index('ix_bookmarks_user_id_id', 'bookmarks', ['user_id', 'id'], unique=False,
+                        postgresql_concurrently=True)
+        # community_uploads WHERE status = ? ORDER BY id
+        op.create_index('ix_community_uploads_status_id', 'community_uploads', ['status', 'id'], unique=False,
+                        postgresql_concurrently=True)
+        # Moderation queue only; stays small as approved rows accumulate
+        op.create_index('ix_community_uploads_pending_id', 'community_uploads', ['id'], unique=False,
+                        postgresql_where=PENDING_FILTER, sqlite_where=PENDING_FILTER,
+                        postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_community_uploads_pending_id', table_name='community_uploads',
+                      postgresql_concurrently=True)
+        op.drop_index('ix_community_uploads_status_id', table_name='community_uploads',
+                      postgresql_concurrently=True)
+        op.drop_index('ix_bookmarks_user_id_id', table_name='bookmarks',
+                      postgresql_concurrently=True)
@@ -0,0 +1,38 @@
+"""Make bookmark URLs unique per user
+
+Revision ID: c71d4b9e0a56
+Revises: a3c5e8f21b47
+Create Date: 2026-10-18 11:03:27.904115
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c71d4b9e0a56'
+down_revision: Union[str, None] = 'a3c5e8f21b47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Keep only the newest copy of each (user_id, url) so the constraint can be created
+    op.execute(
+        """
+        DELETE FROM bookmarks
+        WHERE id NOT IN (
+            SELECT MAX(id) FROM bookmarks GROUP BY user_id, url
+        )
+        AND url IS NOT NULL
+        """
+    )
+    op.create_unique_constraint('uq_bookmarks_user_id_url', 'bookmarks', ['user_id', 'url'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('uq_bookmarks_user_id_url', 'bookmarks', type_='unique')
@@ -0,0 +1,308 @@
+import asyncio
+import inspect
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+
+async def resolve(result):
+    """Await a backend call's result if it is awaitable, so sync and async backends work alike."""
+    return await result if inspect.isawaitable(result) else result
+
+
+class MemoryCache:
+    """In-process LRU store holding (value, stored_at) entries, bounded by entry count."""
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+
+    def get(self, key: str):
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)  # Mark as most recently used
+        return entry
+
+    def set(self, key: str, value, stored_at: float):
+        self._entries[key] = (value, stored_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)  # Evict the least recently used entry
+
+    def delete(self, key: str):
+        self._entries.pop(key, None)
+
+    def count(self) -> int:
+        return len(self._entries)
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class SQLiteCache:
+    """
+    On-disk store holding (value, stored_at) entries in a SQLite file, shared by every worker process.
+
+    Values are stored as JSON. WAL mode lets readers proceed while one process writes.
+    Entries older than `max_age` are purged, and the least recently used ones are
+    evicted once the stored values exceed `max_bytes`. Triggers keep the running
+    total size in a meta row. The methods are awaitable and run in worker threads,
+    so waiting on another process's write lock never blocks the event loop.
+    """
+
+    TOUCH_INTERVAL = 60  # Seconds between last-used updates of an entry, to keep reads mostly read-only
+
+    SCHEMA = [
+        "CREATE TABLE IF NOT EXISTS cache_entries ("
+        "key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, "
+        "stored_at REAL NOT NULL, used_at REAL NOT NULL)",
+        "CREATE INDEX IF NOT EXISTS ix_cache_entries_used_at ON cache_entries (used_at)",
+        "CREATE INDEX IF NOT EXISTS ix_cache_entries_stored_at ON cache_entries (stored_at)",
+        "CREATE TABLE IF NOT EXISTS cache_meta (name TEXT PRIMARY KEY, value INTEGER NOT NULL)",
+        "INSERT OR IGNORE INTO cache_meta (name, value) "
+        "SELECT 'total_size', COALESCE(SUM(size), 0) FROM cache_entries",
+        "CREATE TRIGGER IF NOT EXISTS cache_entries_size_insert AFTER INSERT ON cache_entries BEGIN "
+        "UPDATE cache_meta SET value = value + NEW.size WHERE name = 'total_size'; END",
+        "CREATE TRIGGER IF NOT EXISTS cache_entries_size_update AFTER UPDATE OF size ON cache_entries BEGIN "
+        "UPDATE cache_meta SET value = value + NEW.size - OLD.size WHERE name = 'total_size'; END",
+        "CREATE TRIGGER IF NOT EXISTS cache_entries_size_delete AFTER DELETE ON cache_entries BEGIN "
+        "UPDATE cache_meta SET value = value - OLD.size WHERE name = 'total_size'; END",
+    ]
+
+    def __init__(self, path: str, max_bytes: int = 256 * 1024 * 1024, max_age: float = 86400):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self._local = threading.local()
+
+    def _connection(self) -> sqlite3.Connection:
+        # One connection per thread and process: connections can't be shared across threads or a fork
+        if getattr(self._local, "pid", None) != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("BEGIN IMMEDIATE")
+            for statement in self.SCHEMA:
+                conn.execute(statement)
+            conn.execute("COMMIT")
+            self._local.conn, self._local.pid = conn, os.getpid()
+        return self._local.conn
+
+    def _get(self, key: str):
+        conn = self._connection()
+        row = conn.execute("SELECT value, stored_at, used_at FROM cache_entries WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        value, stored_at, used_at = row
+        if time.time() - stored_at > self.max_age:
+            conn.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+            return None
+        if time.time() - used_at > self.TOUCH_INTERVAL:
+            conn.execute("UPDATE cache_entries SET used_at = ? WHERE key = ?", (time.time(), key))
+        return json.loads(value), stored_at
+
+    def _set(self, key: str, encoded: str, stored_at: float):
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(
+                "INSERT INTO cache_entries (key, value, size, stored_at, used_at) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (key) DO UPDATE SET value = excluded.value, size = excluded.size, "
+                "stored_at = excluded.stored_at, used_at = excluded.used_at",
+                (key, encoded, len(encoded), stored_at, time.time()),
+            )
+            conn.execute("DELETE FROM cache_entries WHERE stored_at < ?", (time.time() - self.max_age,))
+            self._evict(conn)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def _evict(self, conn: sqlite3.Connection):
+        """Drop least recently used entries until the stored values fit in `max_bytes`."""
+        excess = conn.execute("SELECT value FROM cache_meta WHERE name = 'total_size'").fetchone()[0] - self.max_bytes
+        if excess <= 0:
+            return
+        freed = 0
+        doomed = []
+        for key, size in conn.execute("SELECT key, size FROM cache_entries ORDER BY used_at"):
+            doomed.append((key,))
+            freed += size
+            if freed >= excess:
+                break
+        conn.executemany("DELETE FROM cache_entries WHERE key = ?", doomed)
+
+    async def get(self, key: str):
+        return await asyncio.to_thread(self._get, key)
+
+    async def set(self, key: str, value, stored_at: float):
+        await asyncio.to_thread(self._set, key, json.dumps(value, default=str), stored_at)
+
+    async def delete(self, key: str):
+        await asyncio.to_thread(lambda: self._connection().execute("DELETE FROM cache_entries WHERE key = ?", (key,)))
+
+    async def count(self) -> int:
+        return await asyncio.to_thread(lambda: self._connection().execute("SELECT COUNT(*) FROM cache_entries").fetchone()[0])
+
+
+class SingleFlight:
+    """Coalesce concurrent calls for the same key onto one in-flight upstream task."""
+
+    def __init__(self):
+        self._inflight = {}
+        self.stats = {"upstream_calls": 0, "coalesced": 0}
+
+    def in_flight(self, key: str) -> bool:
+        return key in self._inflight
+
+    def start(self, key: str, fn) -> asyncio.Task:
+        """Start `fn()` for the key unless a call is already running, and return the shared task."""
+        task = self._inflight.get(key)
+        if task is not None:
+            self.stats["coalesced"] += 1
+            return task
+
+        self.stats["upstream_calls"] += 1
+        task = asyncio.ensure_future(fn())
+        self._inflight[key] = task
+        task.add_done_callback(lambda done: self._finish(key, done))
+        return task
+
+    async def do(self, key: str, fn):
+        # Shield the shared task so one caller timing out doesn't cancel it for everyone else
+        return await asyncio.shield(self.start(key, fn))
+
+    def _finish(self, key: str, task: asyncio.Task):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # Mark as retrieved; callers still see it when awaiting
+
+
+class SearchCache:
+    """
+    TTL cache for upstream search results with stale-while-revalidate.
+
+    Fresh entries are served directly. Entries past their TTL but within the
+    stale window are served immediately while a background task refreshes them.
+    Concurrent loads of the same key share a single upstream call.
+    The storage backend is pluggable: anything with get/set/delete/count, returning
+    either plain values (MemoryCache) or awaitables (SQLiteCache).
+    `listeners` are called as listener(source, query, key, fetcher) on every non-bypassed lookup.
+    Backend errors (e.g. a locked shared SQLite file) fail open: a failed read is a miss,
+    a failed write just isn't stored, and both are counted in `backend_errors`.
+    """
+
+    def __init__(self, backend, ttls: dict, default_ttl: float = 300, stale_ttl: float = 600):
+        self.backend = backend
+        self.ttls = ttls
+        self.default_ttl = default_ttl
+        self.stale_ttl = stale_ttl
+        self.stats = {"hits": 0, "stale_hits": 0, "misses": 0, "bypasses": 0, "refreshes": 0, "backend_errors": 0}
+        self.flight = SingleFlight()
+        self.listeners = []
+
+    @staticmethod
+    def normalize_query(query: str) -> str:
+        return " ".join(query.lower().split())
+
+    @staticmethod
+    def make_key(source: str, query: str, page: int, page_size: int, variant=None) -> str:
+        """Normalize (source, query, page, page size) into a cache key."""
+        parts = [source, SearchCache.normalize_query(query), page, page_size]
+        if variant is not None:
+            parts.append(variant)
+        return "|".join(str(part) for part in parts)
+
+    def ttl_for(self, source: str) -> float:
+        return self.ttls.get(source, self.default_ttl)
+
+    async def fetch(self, source: str, query: str, page: int, page_size: int, fetcher,
+                    bypass: bool = False, variant=None):
+        """
+        Return cached results for the normalized key, calling `fetcher()` on a miss.
+        `bypass=True` (e.g. Cache-Control: no-cache) always goes upstream and stores the fresh result.
+        """
+        key = self.make_key(source, query, page, page_size, variant)
+
+        if bypass:
+            self.stats["bypasses"] += 1
+            return await self._load(key, fetcher)
+
+        for listener in self.listeners:
+            listener(source, query, key, fetcher)
+
+        entry = await self._backend_get(key)
+        if entry is not None:
+            value, stored_at = entry
+            age = time.time() - stored_at
+            ttl = self.ttl_for(source)
+            if age < ttl:
+                self.stats["hits"] += 1
+                return value
+            if age < ttl + self.stale_ttl:
+                self.stats["stale_hits"] += 1
+                self._schedule_refresh(key, fetcher)
+                return value
+
+        self.stats["misses"] += 1
+        return await self._load(key, fetcher)
+
+    async def expires_in(self, source: str, key: str):
+        """Seconds until the entry's TTL runs out (negative once stale), or None if it isn't cached."""
+        entry = await self._backend_get(key)
+        if entry is None:
+            return None
+        return entry[1] + self.ttl_for(source) - time.time()
+
+    async def refresh(self, key: str, fetcher):
+        """Reload the key from upstream now, sharing any load already in flight."""
+        return await self._load(key, fetcher)
+
+    async def _backend_get(self, key: str):
+        try:
+            return await resolve(self.backend.get(key))
+        except Exception as e:
+            self.stats["backend_errors"] += 1
+            print(f"Cache read failed for key '{key}', treating it as a miss: {e}")
+            return None
+
+    async def _load(self, key: str, fetcher):
+        return await self.flight.do(key, lambda: self._fetch_and_store(key, fetcher))
+
+    async def _fetch_and_store(self, key: str, fetcher):
+        value = await fetcher()
+        # Empty results are usually a swallowed upstream error, so don't pin them for a whole TTL
+        if value:
+            try:
+                await resolve(self.backend.set(key, value, time.time()))
+            except Exception as e:
+                self.stats["backend_errors"] += 1
+                print(f"Cache write failed for key '{key}', serving the result uncached: {e}")
+        return value
+
+    def _schedule_refresh(self, key: str, fetcher):
+        if self.flight.in_flight(key):
+            return  # A load for this key is already running
+        task = self.flight.start(key, lambda: self._fetch_and_store(key, fetcher))
+        task.add_done_callback(lambda done: self._refresh_done(key, done))
+
+    def _refresh_done(self, key: str, task: asyncio.Task):
+        if task.cancelled():
+            return
+        if task.exception() is not None:
+            print(f"Background refresh failed for cache key '{key}': {task.exception()}")
+        else:
+            self.stats["refreshes"] += 1
+
+    async def snapshot(self) -> dict:
+        lookups = self.stats["hits"] + self.stats["stale_hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            **self.flight.stats,
+            "entries": await resolve(self.backend.count()),
+            "hit_ratio": round((self.stats["hits"] + self.stats["stale_hits"]) / lookups, 3) if lookups else 0.0,
+        }
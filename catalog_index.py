@@ -0,0 +1,67 @@
+import re
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Dict, List
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Weight of a term occurrence per field; title hits matter most
+DEFAULT_FIELD_BOOSTS = {"title": 3.0, "author": 2.0, "platform": 1.5, "description": 1.0}
+
+PREFIX_MIN_LENGTH = 3  # Shorter terms only match whole tokens ("ai" shouldn't match "aide")
+PREFIX_WEIGHT = 0.5  # A prefix hit ("neur" -> "neural") counts half as much as an exact one
+
+
+def tokenize(text: str) -> List[str]:
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+class CatalogIndex:
+    """
+    Tokenized inverted index over a list of resource dicts, built once.
+    Supports multi-term AND/OR queries, prefix matching and per-field boosts.
+    """
+
+    def __init__(self, documents: List[dict], field_boosts: Dict[str, float] = None):
+        self.documents = documents
+        self.field_boosts = field_boosts or DEFAULT_FIELD_BOOSTS
+
+        # token -> {document id: boosted term weight}
+        self.postings = defaultdict(dict)
+        for doc_id, document in enumerate(documents):
+            for field, boost in self.field_boosts.items():
+                for token in tokenize(document.get(field) or ""):
+                    self.postings[token][doc_id] = self.postings[token].get(doc_id, 0.0) + boost
+
+        # Sorted vocabulary, so all tokens sharing a prefix form one contiguous range
+        self.vocabulary = sorted(self.postings)
+
+    def _match_term(self, term: str, prefix: bool) -> Dict[int, float]:
+        scores = dict(self.postings.get(term, {}))
+        if not prefix or len(term) < PREFIX_MIN_LENGTH:
+            return scores
+
+        position = bisect_left(self.vocabulary, term)
+        while position < len(self.vocabulary) and self.vocabulary[position].startswith(term):
+            token = self.vocabulary[position]
+            position += 1
+            if token == term:
+                continue
+            for doc_id, weight in self.postings[token].items():
+                scores[doc_id] = max(scores.get(doc_id, 0.0), weight * PREFIX_WEIGHT)
+        return scores
+
+    def search(self, query: str, mode: str = "and", prefix: bool = True) -> List[dict]:
+        """Return matching documents, best first. `mode="and"` requires every term, `"or"` any term."""
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+
+        term_matches = [self._match_term(term, prefix) for term in terms]
+        if mode == "or":
+            doc_ids = set().union(*term_matches)
+        else:
+            doc_ids = set(term_matches[0]).intersection(*term_matches[1:])
+
+        scores = {doc_id: sum(matches.get(doc_id, 0.0) for matches in term_matches) for doc_id in doc_ids}
+        return [self.documents[doc_id] for doc_id in sorted(doc_ids, key=lambda doc_id: (-scores[doc_id], doc_id))]
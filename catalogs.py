@@ -0,0 +1,138 @@
+# Curated AI/ML handbooks and courses, served as-is and indexed by catalog_index.CatalogIndex
+
+AI_HANDBOOKS = [
+    {
+        "resource_type": "handbook",
+        "title": "Deep Learning",
+        "url": "https://www.deeplearningbook.org/",
+        "thumbnail": "https://upload.wikimedia.org/wikipedia/en/6/68/Deep_Learning_Book_cover.jpg",
+        "description": "Comprehensive deep learning book by Ian Goodfellow, Yoshua Bengio, and Aaron Courville.",
+        "platform": "Book",
+        "author": "Ian Goodfellow, Yoshua Bengio, Aaron Courville",
+        "publication_year": "2016"
+    },
+    {
+        "resource_type": "handbook",
+        "title": "Stanford CS229 Machine Learning Notes",
+        "url": "https://cs229.stanford.edu/",
+        "thumbnail": "https://upload.wikimedia.org/wikipedia/commons/8/80/Andrew_Ng.png",
+        "description": "Lecture notes from Stanford's CS229 course by Andrew Ng.",
+        "platform": "Course Notes",
+        "author": "Andrew Ng",
+        "publication_year": "Ongoing"
+    },
+    {
+        "resource_type": "handbook",
+        "title": "MIT 6.S191: Introduction to Deep Learning",
+        "url": "https://introtodeeplearning.com/",
+        "thumbnail": "https://introtodeeplearning.com/assets/logo.png",
+        "description": "MIT’s official introductory deep learning course materials.",
+        "platform": "Course Notes",
+        "author": "MIT Deep Learning",
+        "publication_year": "Ongoing"
+    },
+    {
+        "resource_type": "handbook",
+        "title": "Pattern Recognition and Machine Learning",
+        "url": "https://www.microsoft.com/en-us/research/people/cmbishop/prml-book/",
+        "thumbnail": "https://www.microsoft.com/en-us/research/uploads/prod/2016/11/prml-cover.jpg",
+        "description": "Comprehensive book on probabilistic machine learning by Christopher Bishop.",
+        "platform": "Book",
+        "author": "Christopher Bishop",
+        "publication_year": "2006"
+    }
+]
+
+# Popular AI/ML Courses from multiple platforms
+AI_COURSES = [
+    {
+        "resource_type": "courses",
+        "title": "Machine Learning Specialization",
+        "url": "https://www.coursera.org/specializations/machine-learning-introduction",
+        "thumbnail": "https://d3njjcbhbojbot.cloudfront.net/api/utilities/v1/imageproxy/https://s3.amazonaws.com/coursera-course-assets/topics/ml/large-icon.png",
+        "platform": "Coursera",
+        "description": "Master Machine Learning from Stanford University. Learn Supervised, Unsupervised, and Reinforcement Learning.",
+        "author": "Andrew Ng, Instructors"
+    },
+    {
+        "resource_type": "courses",
+        "title": "Deep Learning Specialization",
+        "url": "https://www.coursera.org/specializations/deep-learning",
+        "thumbnail": "https://d3njjcbhbojbot.cloudfront.net/api/utilities/v1/imageproxy/https://s3.amazonaws.com/coursera-course-assets/topics/deeplearning/large-icon.png",
+        "platform": "Coursera",
+        "description": "Master Deep Learning and Neural Networks. Build and train neural networks using TensorFlow and PyTorch.",
+        "author": "Andrew Ng, Instructors"
+    },
+    {
+        "resource_type": "courses",
+        "title": "Artificial Intelligence A-Z: Learn by Doing",
+        "url": "https://www.udemy.com/course/artificial-intelligence-az/",
+        "thumbnail": "https://img-c.udemycdn.com/course/750x422/1435544_466e_3.jpg",
+        "platform": "Udemy",
+        "description": "Build AI projects using AI algorithms. Master AI, Deep Learning, and Machine Learning with real projects.",
+        "author": "Hadelin de Ponteves, Kirill Eremenko"
+    },
+    {
+        "resource_type": "courses",
+        "title": "TensorFlow Developer Certificate in Collaboration with Google",
+        "url": "https://www.coursera.org/professional-certificates/tensorflow-in-practice",
+        "thumbnail": "https://d3njjcbhbojbot.cloudfront.net/api/utilities/v1/imageproxy/https://s3.amazonaws.com/coursera-course-assets/topics/tensorflow/large-icon.png",
+        "platform": "Coursera",
+        "description": "Learn to build and train neural networks using TensorFlow. Get TensorFlow Developer Certificate recognition.",
+        "author": "Laurence Moroney, Google"
+    },
+    {
+        "resource_type": "courses",
+        "title": "Introduction to Artificial Intelligence with Python",
+        "url": "https://cs50.harvard.edu/ai/",
+        "thumbnail": "https://cs50.harvard.edu/ai/image.png",
+        "platform": "Harvard CS50",
+        "description": "Learn to use libraries for AI, including scikit-learn, TensorFlow, and Keras.",
+        "author": "Harvard University, CS50"
+    },
+    {
+        "resource_type": "courses",
+        "title": "AI for Everyone",
+        "url": "https://www.coursera.org/learn/ai-for-everyone",
+        "thumbnail": "https://d3njjcbhbojbot.cloudfront.net/api/utilities/v1/imageproxy/https://s3.amazonaws.com/coursera-course-assets/topics/aiforeveryone/large-icon.png",
+        "platform": "Coursera",
+        "description": "Learn what AI can do, how it works, and how it can transform your business.",
+        "author": "Andrew Ng"
+    },
+    {
+        "resource_type": "courses",
+        "title": "Practical Deep Learning for Coders",
+        "url": "https://course.fast.ai/",
+        "thumbnail": "https://course.fast.ai/images/fastai_logo.png",
+        "platform": "Fast.ai",
+        "description": "Master practical deep learning for computer vision, NLP, and more using PyTorch.",
+        "author": "Jeremy Howard, fast.ai"
+    },
+    {
+        "resource_type": "courses",
+        "title": "Natural Language Processing Specialization",
+        "url": "https://www.coursera.org/specializations/natural-language-processing",
+        "thumbnail": "https://d3njjcbhbojbot.cloudfront.net/api/utilities/v1/imageproxy/https://s3.amazonaws.com/coursera-course-assets/topics/nlp/large-icon.png",
+        "platform": "Coursera",
+        "description": "Master NLP techniques including RNNs, LSTMs, and Transformers.",
+        "author": "Instructors, Coursera"
+    },
+    {
+        "resource_type": "courses",
+        "title": "Computer Vision Masterclass",
+        "url": "https://www.udemy.com/course/computer-vision-masterclass/",
+        "thumbnail": "https://img-c.udemycdn.com/course/750x422/2454633_4c40_2.jpg",
+        "platform": "Udemy",
+        "description": "Build 25+ Computer Vision projects using OpenCV and Deep Learning.",
+        "author": "Ahmed Fawzy Gad"
+    },
+    {
+        "resource_type": "courses",
+        "title": "Reinforcement Learning Specialization",
+        "url": "https://www.coursera.org/specializations/reinforcement-learning",
+        "thumbnail": "https://d3njjcbhbojbot.cloudfront.net/api/utilities/v1/imageproxy/https://s3.amazonaws.com/coursera-course-assets/topics/reinforcementlearning/large-icon.png",
+        "platform": "Coursera",
+        "description": "Master Reinforcement Learning from the ground up. Learn to build intelligent agents.",
+        "author": "Mark Rowland, Martha White, Adam White"
+    }
+]
@@ -1,6 +1,11 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy import exc
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy.orm import declarative_base
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 import os
+import time
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -34,18 +39,137 @@ if not DATABASE_URL:
 db_info = DATABASE_URL.split("@")[-1] if "@" in DATABASE_URL else "unknown"
 print(f"📦 Connecting to database: ...@{db_info}")
 
-# Create database engine
-engine = create_engine(DATABASE_URL)
+# Async drivers for each sync URL scheme (asyncpg for Postgres, aiosqlite for local/test SQLite)
+ASYNC_DRIVERS = {
+    "postgres": "postgresql+asyncpg",  # Heroku/Render style scheme
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
 
-# Create a session maker
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+def to_async_url(database_url: str):
+    """Convert DATABASE_URL to its async-driver form, returning (url, connect_args)."""
+    url = make_url(database_url)
+    url = url.set(drivername=ASYNC_DRIVERS.get(url.drivername, url.drivername))
+
+    connect_args = {}
+    # asyncpg does not understand libpq's sslmode query parameter, it takes `ssl` instead
+    if url.drivername == "postgresql+asyncpg" and "sslmode" in url.query:
+        connect_args["ssl"] = url.query["sslmode"]
+        url = url.difference_update_query(["sslmode"])
+    return url, connect_args
+
+
+ASYNC_DATABASE_URL, ASYNC_CONNECT_ARGS = to_async_url(DATABASE_URL)
+
+# Connection pool settings
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 5))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 10))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", 30))  # Seconds to wait for a free connection
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", 1800))  # Seconds before a connection is replaced
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+
+# Upper bounds (ms) of the checkout wait time histogram buckets
+POOL_WAIT_BUCKETS_MS = [1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000]
+# Per-bucket (not cumulative) counts, keyed by range: "ms_0_1", "ms_1_5", ..., "ms_5000_inf"
+POOL_WAIT_BUCKET_NAMES = [
+    f"ms_{lower}_{upper}" for lower, upper in zip([0] + POOL_WAIT_BUCKETS_MS, POOL_WAIT_BUCKETS_MS + ["inf"])
+]
+
+pool_stats = {
+    "checkouts": 0,
+    "checkout_timeouts": 0,
+    "wait_ms_total": 0.0,
+    "wait_ms_histogram": {name: 0 for name in POOL_WAIT_BUCKET_NAMES},
+}
+
+
+def record_pool_wait(wait_ms: float):
+    pool_stats["checkouts"] += 1
+    pool_stats["wait_ms_total"] += wait_ms
+    index = next((i for i, bound in enumerate(POOL_WAIT_BUCKETS_MS) if wait_ms <= bound), len(POOL_WAIT_BUCKETS_MS))
+    pool_stats["wait_ms_histogram"][POOL_WAIT_BUCKET_NAMES[index]] += 1
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long each checkout waited and how often it timed out."""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            pool_stats["checkout_timeouts"] += 1
+            raise
+        record_pool_wait((time.perf_counter() - started) * 1000)
+        return connection
+
+
+def get_pool_stats() -> dict:
+    """Live pool state plus the checkout counters collected by InstrumentedQueuePool."""
+    pool = engine.pool
+    if not isinstance(pool, InstrumentedQueuePool):
+        return {"pool": type(pool).__name__}
+    return {
+        "pool": type(pool).__name__,
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": pool.overflow(),
+        "max_overflow": DB_MAX_OVERFLOW,
+        "timeout": DB_POOL_TIMEOUT,
+        **pool_stats,
+        "wait_ms_total": round(pool_stats["wait_ms_total"], 3),
+        "wait_ms_histogram": dict(pool_stats["wait_ms_histogram"]),
+    }
+
+
+# In-memory SQLite needs its single shared connection, so it keeps SQLAlchemy's default pool
+if ASYNC_DATABASE_URL.drivername.startswith("sqlite") and ASYNC_DATABASE_URL.database in (None, "", ":memory:"):
+    POOL_OPTIONS = {}
+else:
+    POOL_OPTIONS = {
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+    }
+
+# Create async database engine
+engine = create_async_engine(ASYNC_DATABASE_URL, connect_args=ASYNC_CONNECT_ARGS, **POOL_OPTIONS)
+
+# Create an async session maker
+SessionLocal = async_sessionmaker(bind=engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
 
 # Base class for models
 Base = declarative_base()
 
-def get_db():
-    db = SessionLocal()
-    try:
+async def get_db():
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
+
+
+async def upsert_rows(db: AsyncSession, model, rows: list, conflict_columns: list, update_columns: list,
+                      batch_size: int = None, **extra_updates) -> int:
+    """
+    Insert `rows` with multi-row INSERT ... ON CONFLICT DO UPDATE (Postgres or SQLite), setting
+    `update_columns` from the new row plus any `extra_updates` expressions. Doesn't commit.
+    Returns the number of distinct rows written.
+    """
+    # Postgres rejects a statement that touches the same row twice, so the last row per conflict key wins
+    rows = list({tuple(row[column] for column in conflict_columns): row for row in rows}.values())
+    if not rows:
+        return 0
+    dialect_insert = postgresql.insert if db.get_bind().dialect.name == "postgresql" else sqlite.insert
+
+    batch_size = batch_size or len(rows)
+    for start in range(0, len(rows), batch_size):
+        insert_stmt = dialect_insert(model).values(rows[start:start + batch_size])
+        await db.execute(insert_stmt.on_conflict_do_update(
+            index_elements=conflict_columns,
+            set_={**{column: insert_stmt.excluded[column] for column in update_columns}, **extra_updates},
+        ))
+    return len(rows)
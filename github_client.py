@@ -0,0 +1,138 @@
+import asyncio
+import time
+
+import httpx
+
+from cache import MemoryCache
+
+
+class GitHubRateLimited(Exception):
+    """The quota is exhausted and resets too far in the future to wait for."""
+
+
+class GitHubClient:
+    """
+    Rate-limit-aware GET access to the GitHub API.
+
+    Tracks X-RateLimit-* headers per quota bucket ("search", "core", ...) and, when a
+    bucket runs low, spaces requests evenly over the time left until it resets; when it
+    is exhausted, waits for the reset (up to `max_wait`) or raises GitHubRateLimited.
+    Responses carrying an ETag are remembered and revalidated with If-None-Match, so an
+    unchanged resource comes back as a 304, which doesn't count against the quota.
+    Search responses are left out: their pages are large, and SearchCache already
+    keeps the parsed results.
+    """
+
+    UNCACHED_BUCKETS = {"search"}  # Buckets whose response bodies aren't kept for revalidation
+
+    def __init__(self, get_client, etag_entries: int = 2048, reserve: int = 1, max_wait: float = 5,
+                 pace_below: float = 0.1):
+        self.get_client = get_client  # Returns the shared httpx.AsyncClient
+        self.etags = MemoryCache(etag_entries)  # Request key -> ((etag, body, content type), stored_at)
+        self.reserve = reserve  # Requests kept back from every bucket
+        self.max_wait = max_wait  # Longest a request may wait for a reset or a paced slot
+        self.pace_below = pace_below  # Start pacing under this fraction of the bucket's limit
+
+        self.buckets = {}  # bucket -> {"limit", "remaining", "reset"}
+        self.next_slot = {}  # bucket -> earliest monotonic time the next request may start (pacing or Retry-After)
+        self.stats = {"requests": 0, "not_modified": 0, "paced": 0, "waited_s": 0.0, "rejected": 0}
+
+    @staticmethod
+    def bucket_for(url: str) -> str:
+        return "search" if "/search/" in url else "core"
+
+    async def _wait_for_quota(self, bucket: str, conditional: bool = False):
+        # Honour a Retry-After from a secondary rate limit, however much primary quota is left
+        held_for = self.next_slot.get(bucket, 0) - time.monotonic()
+        if held_for > 0:
+            if held_for > self.max_wait:
+                self.stats["rejected"] += 1
+                raise GitHubRateLimited(f"GitHub {bucket} requests held back for {held_for:.0f}s (Retry-After)")
+            await self._sleep(held_for)
+
+        state = self.buckets.get(bucket)
+        if state is None or conditional:
+            return  # No headers seen yet, or an ETag revalidation, which is free when it comes back 304
+
+        reset_in = max(0.0, state["reset"] - time.time())
+        if state["remaining"] <= self.reserve and reset_in > 0:
+            if reset_in > self.max_wait:
+                self.stats["rejected"] += 1
+                raise GitHubRateLimited(f"GitHub {bucket} quota exhausted, resets in {reset_in:.0f}s")
+            await self._sleep(reset_in)
+            state["remaining"] = state["limit"]  # Fresh window; corrected by the next response
+            return
+
+        if state["remaining"] < state["limit"] * self.pace_below and reset_in > 0:
+            # Low on quota: queue requests one interval apart so it lasts until the reset
+            interval = reset_in / max(state["remaining"] - self.reserve, 1)
+            now = time.monotonic()
+            slot = max(now, self.next_slot.get(bucket, now))
+            if slot - now > self.max_wait:
+                self.stats["rejected"] += 1
+                raise GitHubRateLimited(f"GitHub {bucket} quota is low, request queue is full")
+            self.next_slot[bucket] = slot + interval
+            self.stats["paced"] += 1
+            await self._sleep(slot - now)
+
+        state["remaining"] -= 1  # Count requests in flight before their responses arrive
+
+    async def _sleep(self, seconds: float):
+        if seconds > 0:
+            self.stats["waited_s"] = round(self.stats["waited_s"] + seconds, 3)
+            await asyncio.sleep(seconds)
+
+    def _record_quota(self, bucket: str, response: httpx.Response):
+        headers = response.headers
+        bucket = headers.get("x-ratelimit-resource", bucket)
+        retry_after = headers.get("retry-after")
+        if response.status_code in (403, 429) and retry_after and retry_after.isdigit():
+            # Secondary rate limit: hold this bucket's next request back
+            self.next_slot[bucket] = time.monotonic() + int(retry_after)
+
+        if "x-ratelimit-remaining" not in headers:
+            return
+        self.buckets[bucket] = {
+            "limit": int(headers.get("x-ratelimit-limit", 0)),
+            "remaining": int(headers["x-ratelimit-remaining"]),
+            "reset": float(headers.get("x-ratelimit-reset", time.time())),
+        }
+
+    async def get(self, url: str, params: dict = None) -> httpx.Response:
+        """GET `url`, pacing against the quota and revalidating cached responses with their ETag."""
+        bucket = self.bucket_for(url)
+        key = str(httpx.URL(url, params=params))
+        revalidate = bucket not in self.UNCACHED_BUCKETS
+        cached = self.etags.get(key) if revalidate else None
+        headers = {"If-None-Match": cached[0][0]} if cached is not None else None
+
+        await self._wait_for_quota(bucket, conditional=cached is not None)
+
+        self.stats["requests"] += 1
+        response = await self.get_client().get(url, params=params, headers=headers)
+        self._record_quota(bucket, response)
+
+        if response.status_code == 304 and cached is not None:
+            self.stats["not_modified"] += 1
+            _, body, content_type = cached[0]
+            return httpx.Response(200, content=body, headers={"Content-Type": content_type}, request=response.request)
+
+        etag = response.headers.get("etag")
+        if revalidate and response.status_code == 200 and etag:
+            self.etags.set(key, (etag, response.content, response.headers.get("content-type", "application/json")), time.time())
+        return response
+
+    def snapshot(self) -> dict:
+        now = time.time()
+        return {
+            "buckets": {
+                bucket: {
+                    "limit": state["limit"],
+                    "remaining": state["remaining"],
+                    "resets_in_s": max(0, round(state["reset"] - now)),
+                }
+                for bucket, state in self.buckets.items()
+            },
+            **self.stats,
+            "etags": len(self.etags),
+        }
@@ -0,0 +1,98 @@
+import argparse
+import asyncio
+import os
+from typing import List, Optional
+
+from sqlalchemy import func
+
+import models
+from database import SessionLocal, upsert_rows
+from ranking import DEFAULT_SEED_QUERIES
+
+HARVEST_BATCH_SIZE = int(os.getenv("HARVEST_BATCH_SIZE", 500))  # Rows per multi-row upsert
+HARVEST_GITHUB_PER_PAGE = 100  # GitHub search's maximum page size
+HARVEST_ARXIV_PER_PAGE = 100
+HARVEST_BLOGS_PER_QUERY = 50
+
+
+def normalize_resource(item: dict) -> Optional[dict]:
+    """Map a fetcher dict onto a `resources` row, keeping the dict itself for local searches. None if it has no URL."""
+    url = item.get("url") or item.get("link")
+    if not url:
+        return None
+    return {
+        "url": url,
+        "resource_type": item["resource_type"],
+        "title": " ".join((item.get("title") or item.get("full_name") or item.get("name") or "").split()),
+        "description": " ".join((item.get("description") or item.get("summary") or "").split()),
+        "data": item,
+    }
+
+
+async def upsert_resources(db, items: List[dict]) -> int:
+    """Insert harvested items, refreshing the rows whose URL was harvested before."""
+    rows = [row for row in map(normalize_resource, items) if row is not None]
+    written = await upsert_rows(
+        db, models.Resource, rows, ["url"], ["resource_type", "title", "description", "data"],
+        batch_size=HARVEST_BATCH_SIZE, harvested_at=func.now(),
+    )
+    await db.commit()
+    return written
+
+
+async def harvest(queries: List[str], pages: int = 1) -> int:
+    """Fetch `pages` pages of GitHub, arXiv and Reddit results per query and upsert them; returns rows written."""
+    # Imported here: the app module imports this one for the scheduled harvest
+    import main
+
+    written = 0
+    for query in queries:
+        for page in range(1, pages + 1):
+            fetched = await asyncio.gather(
+                main.fetch_github_repos(query, per_page=HARVEST_GITHUB_PER_PAGE, page=page, include_contributors=False),
+                main.fetch_arxiv_papers(query, max_results=HARVEST_ARXIV_PER_PAGE, page=page),
+                # Reddit search isn't paged; one pass per query
+                main.fetch_blogs(query, max_results=HARVEST_BLOGS_PER_QUERY) if page == 1 else asyncio.sleep(0, []),
+                return_exceptions=True,
+            )
+            items = []
+            for results in fetched:
+                if isinstance(results, Exception):
+                    print(f"Skipping a source for '{query}' page {page}: {results}")
+                    continue
+                items += results
+
+            async with SessionLocal() as db:
+                written += await upsert_resources(db, items)
+        print(f"Harvested '{query}': {written} resources written so far")
+    return written
+
+
+async def harvest_periodically(queries: List[str], interval: float, pages: int = 1):
+    """Re-harvest every `interval` seconds until cancelled (started from the app lifespan)."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await harvest(queries, pages)
+        except Exception as e:
+            print(f"Scheduled harvest failed: {e}")
+
+
+async def harvest_once(queries: List[str], pages: int) -> int:
+    import main
+
+    try:
+        return await harvest(queries, pages)
+    finally:
+        await main.close_reddit_client()
+        await main.close_http_clients()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Harvest upstream search results into the resources table.")
+    parser.add_argument("--queries", default=",".join(DEFAULT_SEED_QUERIES), help="Comma-separated queries")
+    parser.add_argument("--pages", type=int, default=1, help="Result pages to fetch per query and source")
+    args = parser.parse_args()
+
+    total = asyncio.run(harvest_once([query.strip() for query in args.queries.split(",") if query.strip()], args.pages))
+    print(f"Harvest complete: {total} resources written")
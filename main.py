@@ -4,23 +4,25 @@ from fastapi.middleware.cors import CORSMiddleware
 import xml.etree.ElementTree as ET
 from typing import List
 from functools import cmp_to_key
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
 import feedparser
 import ssl
 import certifi
 import urllib.request 
-import praw
+import asyncpraw
 import os
 from dotenv import load_dotenv
 from pydantic import BaseModel, HttpUrl
 import openai
 from sse_starlette.sse import EventSourceResponse
 from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update, func, literal, literal_column, or_
+from sqlalchemy.exc import IntegrityError
+from pydantic import ValidationError
 from passlib.context import CryptContext
-from database import get_db
+from database import get_db, get_pool_stats, upsert_rows, SessionLocal
 import models
 from pydantic import BaseModel
 from models import User
@@ -29,7 +31,31 @@ from fastapi.responses import JSONResponse
 from passlib.context import CryptContext
 from fastapi import Cookie
 from fastapi import Response
+from fastapi import Request
+from fastapi import Header
 import traceback
+from contextlib import asynccontextmanager
+import importlib.util
+import asyncio
+import anyio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import base64
+import hashlib
+import hmac
+import json
+import secrets
+from sqlalchemy import event, inspect as sa_inspect
+import time
+from typing import Optional
+from cache import MemoryCache, SQLiteCache, SearchCache
+from ranking import rank_results, load_ranking_model
+from catalog_index import CatalogIndex
+from catalogs import AI_COURSES, AI_HANDBOOKS
+from prewarm import Prewarmer
+from github_client import GitHubClient, GitHubRateLimited
+from harvest import harvest_periodically
+from ranking import DEFAULT_SEED_QUERIES
 
 
 
@@ -40,7 +66,30 @@ import traceback
 load_dotenv()
 
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create app-scoped resources on startup and release them on shutdown."""
+    create_http_clients()
+    create_reddit_client()
+    load_ranking_model()
+    prewarmer.start()
+    harvest_task = None
+    if HARVEST_INTERVAL > 0:
+        harvest_task = asyncio.create_task(harvest_periodically(HARVEST_QUERIES, HARVEST_INTERVAL, HARVEST_PAGES))
+    yield
+    if harvest_task is not None:
+        harvest_task.cancel()
+        try:
+            await harvest_task
+        except asyncio.CancelledError:
+            pass
+    await prewarmer.stop()
+    await close_reddit_client()
+    await close_http_clients()
+    await openai_client.close()
+
+
+app = FastAPI(lifespan=lifespan)
 
 port = int(os.getenv("PORT", 8000))  # Use PORT from environment, default to 8000 for local testing
 
@@ -52,146 +101,46 @@ app.include_router(bookmark_router, prefix="/bookmarks", tags=["Bookmarks"])
 # app.include_router(auth_router, prefix="/auth", tags=["Authentication"])
 # app.include_router(bookmark_router, prefix="/bookmarks", tags=["Bookmarks"])
 
-AI_HANDBOOKS = [
-    {
-        "resource_type": "handbook",
-        "title": "Deep Learning",
-        "url": "https://www.deeplearningbook.org/",
-        "thumbnail": "https://upload.wikimedia.org/wikipedia/en/6/68/Deep_Learning_Book_cover.jpg",
-        "description": "Comprehensive deep learning book by Ian Goodfellow, Yoshua Bengio, and Aaron Courville.",
-        "platform": "Book",
-        "author": "Ian Goodfellow, Yoshua Bengio, Aaron Courville",
-        "publication_year": "2016"
-    },
-    {
-        "resource_type": "handbook",
-        "title": "Stanford CS229 Machine Learning Notes",
-        "url": "https://cs229.stanford.edu/",
-        "thumbnail": "https://upload.wikimedia.org/wikipedia/commons/8/80/Andrew_Ng.png",
-        "description": "Lecture notes from Stanford's CS229 course by Andrew Ng.",
-        "platform": "Course Notes",
-        "author": "Andrew Ng",
-        "publication_year": "Ongoing"
-    },
-    {
-        "resource_type": "handbook",
-        "title": "MIT 6.S191: Introduction to Deep Learning",
-        "url": "https://introtodeeplearning.com/",
-        "thumbnail": "https://introtodeeplearning.com/assets/logo.png",
-        "description": "MIT’s official introductory deep learning course materials.",
-        "platform": "Course Notes",
-        "author": "MIT Deep Learning",
-        "publication_year": "Ongoing"
-    },
-    {
-        "resource_type": "handbook",
-        "title": "Pattern Recognition and Machine Learning",
-        "url": "https://www.microsoft.com/en-us/research/people/cmbishop/prml-book/",
-        "thumbnail": "https://www.microsoft.com/en-us/research/uploads/prod/2016/11/prml-cover.jpg",
-        "description": "Comprehensive book on probabilistic machine learning by Christopher Bishop.",
-        "platform": "Book",
-        "author": "Christopher Bishop",
-        "publication_year": "2006"
-    }
-]
-
-# Popular AI/ML Courses from multiple platforms
-AI_COURSES = [
-    {
-        "resource_type": "courses",
-        "title": "Machine Learning Specialization",
-        "url": "https://www.coursera.org/specializations/machine-learning-introduction",
-        "thumbnail": "https://d3njjcbhbojbot.cloudfront.net/api/utilities/v1/imageproxy/https://s3.amazonaws.com/coursera-course-assets/topics/ml/large-icon.png",
-        "platform": "Coursera",
-        "description": "Master Machine Learning from Stanford University. Learn Supervised, Unsupervised, and Reinforcement Learning.",
-        "author": "Andrew Ng, Instructors"
-    },
-    {
-        "resource_type": "courses",
-        "title": "Deep Learning Specialization",
-        "url": "https://www.coursera.org/specializations/deep-learning",
-        "thumbnail": "https://d3njjcbhbojbot.cloudfront.net/api/utilities/v1/imageproxy/https://s3.amazonaws.com/coursera-course-assets/topics/deeplearning/large-icon.png",
-        "platform": "Coursera",
-        "description": "Master Deep Learning and Neural Networks. Build and train neural networks using TensorFlow and PyTorch.",
-        "author": "Andrew Ng, Instructors"
-    },
-    {
-        "resource_type": "courses",
-        "title": "Artificial Intelligence A-Z: Learn by Doing",
-        "url": "https://www.udemy.com/course/artificial-intelligence-az/",
-        "thumbnail": "https://img-c.udemycdn.com/course/750x422/1435544_466e_3.jpg",
-        "platform": "Udemy",
-        "description": "Build AI projects using AI algorithms. Master AI, Deep Learning, and Machine Learning with real projects.",
-        "author": "Hadelin de Ponteves, Kirill Eremenko"
-    },
-    {
-        "resource_type": "courses",
-        "title": "TensorFlow Developer Certificate in Collaboration with Google",
-        "url": "https://www.coursera.org/professional-certificates/tensorflow-in-practice",
-        "thumbnail": "https://d3njjcbhbojbot.cloudfront.net/api/utilities/v1/imageproxy/https://s3.amazonaws.com/coursera-course-assets/topics/tensorflow/large-icon.png",
-        "platform": "Coursera",
-        "description": "Learn to build and train neural networks using TensorFlow. Get TensorFlow Developer Certificate recognition.",
-        "author": "Laurence Moroney, Google"
-    },
-    {
-        "resource_type": "courses",
-        "title": "Introduction to Artificial Intelligence with Python",
-        "url": "https://cs50.harvard.edu/ai/",
-        "thumbnail": "https://cs50.harvard.edu/ai/image.png",
-        "platform": "Harvard CS50",
-        "description": "Learn to use libraries for AI, including scikit-learn, TensorFlow, and Keras.",
-        "author": "Harvard University, CS50"
-    },
-    {
-        "resource_type": "courses",
-        "title": "AI for Everyone",
-        "url": "https://www.coursera.org/learn/ai-for-everyone",
-        "thumbnail": "https://d3njjcbhbojbot.cloudfront.net/api/utilities/v1/imageproxy/https://s3.amazonaws.com/coursera-course-assets/topics/aiforeveryone/large-icon.png",
-        "platform": "Coursera",
-        "description": "Learn what AI can do, how it works, and how it can transform your business.",
-        "author": "Andrew Ng"
-    },
-    {
-        "resource_type": "courses",
-        "title": "Practical Deep Learning for Coders",
-        "url": "https://course.fast.ai/",
-        "thumbnail": "https://course.fast.ai/images/fastai_logo.png",
-        "platform": "Fast.ai",
-        "description": "Master practical deep learning for computer vision, NLP, and more using PyTorch.",
-        "author": "Jeremy Howard, fast.ai"
-    },
-    {
-        "resource_type": "courses",
-        "title": "Natural Language Processing Specialization",
-        "url": "https://www.coursera.org/specializations/natural-language-processing",
-        "thumbnail": "https://d3njjcbhbojbot.cloudfront.net/api/utilities/v1/imageproxy/https://s3.amazonaws.com/coursera-course-assets/topics/nlp/large-icon.png",
-        "platform": "Coursera",
-        "description": "Master NLP techniques including RNNs, LSTMs, and Transformers.",
-        "author": "Instructors, Coursera"
-    },
-    {
-        "resource_type": "courses",
-        "title": "Computer Vision Masterclass",
-        "url": "https://www.udemy.com/course/computer-vision-masterclass/",
-        "thumbnail": "https://img-c.udemycdn.com/course/750x422/2454633_4c40_2.jpg",
-        "platform": "Udemy",
-        "description": "Build 25+ Computer Vision projects using OpenCV and Deep Learning.",
-        "author": "Ahmed Fawzy Gad"
-    },
-    {
-        "resource_type": "courses",
-        "title": "Reinforcement Learning Specialization",
-        "url": "https://www.coursera.org/specializations/reinforcement-learning",
-        "thumbnail": "https://d3njjcbhbojbot.cloudfront.net/api/utilities/v1/imageproxy/https://s3.amazonaws.com/coursera-course-assets/topics/reinforcementlearning/large-icon.png",
-        "platform": "Coursera",
-        "description": "Master Reinforcement Learning from the ground up. Learn to build intelligent agents.",
-        "author": "Mark Rowland, Martha White, Adam White"
-    }
-]
+# Inverted indexes over the curated catalogs, built once at startup
+course_index = CatalogIndex(AI_COURSES)
+handbook_index = CatalogIndex(AI_HANDBOOKS)
+
+# Password hashing runs on its own bounded pool so bcrypt never blocks the event loop
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", os.cpu_count() or 2))
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", 12))  # bcrypt cost factor for new hashes
+
+password_executor = ThreadPoolExecutor(max_workers=PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash")
+password_pool_lock = threading.Lock()
+password_pool_stats = {"submitted": 0, "running": 0, "completed": 0, "max_queue_depth": 0}
+
+
+def password_queue_depth() -> int:
+    """Jobs submitted to the password pool that are still waiting for a worker (caller holds the lock)."""
+    return password_pool_stats["submitted"] - password_pool_stats["running"] - password_pool_stats["completed"]
+
+
+async def run_in_password_pool(fn, *args):
+    """Run a CPU-heavy password function on the password pool and await its result."""
+    def job():
+        with password_pool_lock:
+            password_pool_stats["running"] += 1
+        try:
+            return fn(*args)
+        finally:
+            with password_pool_lock:
+                password_pool_stats["running"] -= 1
+                password_pool_stats["completed"] += 1
+
+    with password_pool_lock:
+        password_pool_stats["submitted"] += 1
+        password_pool_stats["max_queue_depth"] = max(password_pool_stats["max_queue_depth"], password_queue_depth())
+
+    return await asyncio.get_running_loop().run_in_executor(password_executor, job)
+
 
 def hash_password(password: str) -> str:
     # Generate a salt
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
     # Hash the password with the salt
     hashed_password = bcrypt.hashpw(password.encode('utf-8'), salt)
     return hashed_password.decode('utf-8')
@@ -203,17 +152,113 @@ pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
-def get_current_user(user_id: str = Cookie(None), db: Session = Depends(get_db)):
-    print(f"Received user_id: {user_id}")
+# Signed, expiring session tokens (stored in the "session" cookie)
+SESSION_SECRET = os.getenv("SESSION_SECRET")
+if not SESSION_SECRET:
+    # Every worker process must sign with the same secret, so a random one is only fine locally
+    is_render = os.getenv("RENDER") is not None or os.path.exists("/opt/render")
+    if is_render:
+        raise ValueError(
+            "SESSION_SECRET environment variable is not set! "
+            "Set it in your service's environment variables so all workers and deploys share one signing key."
+        )
+    SESSION_SECRET = secrets.token_hex(32)
+    print("⚠️  SESSION_SECRET is not set, using a random secret. Sessions will not survive a restart "
+          "and only work with a single worker process.")
+SESSION_TTL = int(os.getenv("SESSION_TTL", 7 * 24 * 3600))  # Seconds
+
+# Small per-process TTL cache of users so authenticated requests skip the users table.
+# An admin flag changed elsewhere (another worker, plain SQL) is picked up within USER_CACHE_TTL.
+USER_CACHE_TTL = float(os.getenv("USER_CACHE_TTL", 300))
+user_cache = MemoryCache(int(os.getenv("USER_CACHE_MAX_ENTRIES", 1024)))
+
 
-    if user_id is None:
+class CurrentUser(BaseModel):
+    id: int
+    email: str
+    is_admin: bool
+
+
+def sign_session_payload(body: str) -> str:
+    digest = hmac.new(SESSION_SECRET.encode(), body.encode(), hashlib.sha256).digest()
+    return base64.urlsafe_b64encode(digest).decode().rstrip("=")
+
+
+def create_session_token(user: User) -> str:
+    """Encode the user id and expiry into a signed token. The admin flag is always read from the user record."""
+    payload = {"uid": user.id, "exp": int(time.time()) + SESSION_TTL}
+    body = base64.urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode()).decode().rstrip("=")
+    return f"{body}.{sign_session_payload(body)}"
+
+
+def read_session_token(token: str) -> Optional[dict]:
+    """Return the token's claims, or None if it is malformed, tampered with or expired."""
+    body, _, signature = token.partition(".")
+    if not body or not hmac.compare_digest(signature, sign_session_payload(body)):
+        return None
+    try:
+        claims = json.loads(base64.urlsafe_b64decode(body + "=" * (-len(body) % 4)))
+    except ValueError:
+        return None
+    if claims.get("exp", 0) < time.time():
+        return None
+    return claims
+
+
+def cache_user(user: User) -> CurrentUser:
+    current_user = CurrentUser(id=user.id, email=user.email, is_admin=bool(user.is_admin))
+    user_cache.set(user.id, current_user, time.time())
+    return current_user
+
+
+def get_cached_user(user_id: int) -> Optional[CurrentUser]:
+    entry = user_cache.get(user_id)
+    if entry is None:
+        return None
+    current_user, stored_at = entry
+    if time.time() - stored_at >= USER_CACHE_TTL:
+        user_cache.delete(user_id)
+        return None
+    return current_user
+
+
+def invalidate_cached_user(user_id: int):
+    user_cache.delete(user_id)
+
+
+@event.listens_for(User, "after_update")
+def invalidate_user_on_admin_change(mapper, connection, target):
+    # Drop the cached row when this process changes a user's admin flag through the ORM;
+    # other processes keep theirs until USER_CACHE_TTL runs out
+    if sa_inspect(target).attrs.is_admin.history.has_changes():
+        invalidate_cached_user(target.id)
+
+
+async def get_current_user(session: str = Cookie(None), db: AsyncSession = Depends(get_db)) -> CurrentUser:
+    if session is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated")
-    
-    user = db.query(User).filter(User.id == user_id).first()
-    if user is None:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid authentication")
-    
-    return user
+
+    claims = read_session_token(session)
+    if claims is None:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid or expired session")
+
+    # The signed token is trusted for identity; the database is only hit on a cache miss
+    current_user = get_cached_user(claims["uid"])
+    if current_user is None:
+        result = await db.execute(select(User).where(User.id == claims["uid"]))
+        user = result.scalars().first()
+        if user is None:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid authentication")
+        current_user = cache_user(user)
+
+    return current_user
+
+
+async def get_admin_user(current_user: CurrentUser = Depends(get_current_user)) -> CurrentUser:
+    """Current user, or 403 unless they are an admin (guards the /debug routes)."""
+    if not current_user.is_admin:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin access required")
+    return current_user
 
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -250,6 +295,143 @@ HEADERS = {
     "Accept": "application/vnd.github.v3+json"
 }
 
+# Shared upstream HTTP clients (one pooled client per upstream, created in lifespan)
+HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", 100))
+HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", 20))
+HTTP_KEEPALIVE_EXPIRY = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", 30))
+HTTP2_ENABLED = os.getenv("HTTP2_ENABLED", "false").lower() == "true"
+GITHUB_TIMEOUT = float(os.getenv("GITHUB_TIMEOUT", 10))
+
+# GitHub quota handling (see github_client.py)
+GITHUB_RATE_LIMIT_RESERVE = int(os.getenv("GITHUB_RATE_LIMIT_RESERVE", 1))  # Requests kept back per quota bucket
+GITHUB_RATE_LIMIT_MAX_WAIT = float(os.getenv("GITHUB_RATE_LIMIT_MAX_WAIT", 5))  # Seconds a request may wait for quota
+GITHUB_ETAG_CACHE_SIZE = int(os.getenv("GITHUB_ETAG_CACHE_SIZE", 2048))
+ARXIV_TIMEOUT = float(os.getenv("ARXIV_TIMEOUT", 15))
+
+# Upstream search result cache (per-source TTLs in seconds)
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "memory")  # "memory" (per process) or "sqlite" (on disk, shared by workers)
+CACHE_PATH = os.getenv("CACHE_PATH", "search_cache.sqlite3")
+CACHE_MAX_BYTES = int(os.getenv("CACHE_MAX_BYTES", 256 * 1024 * 1024))  # Size cap of the sqlite backend
+CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", 1024))
+CACHE_STALE_TTL = float(os.getenv("CACHE_STALE_TTL", 600))  # How long past expiry a stale entry may be served
+CACHE_TTLS = {
+    "github": float(os.getenv("CACHE_TTL_GITHUB", 600)),
+    "research_papers": float(os.getenv("CACHE_TTL_ARXIV", 1800)),
+    "blogs": float(os.getenv("CACHE_TTL_BLOGS", 300)),
+    "repo_details": float(os.getenv("CACHE_TTL_REPO_DETAILS", 3600)),
+}
+
+
+def create_cache_backend():
+    if CACHE_BACKEND == "sqlite":
+        # Nothing older than the longest TTL plus the stale window can still be served
+        return SQLiteCache(CACHE_PATH, max_bytes=CACHE_MAX_BYTES, max_age=max(CACHE_TTLS.values()) + CACHE_STALE_TTL)
+    if CACHE_BACKEND != "memory":
+        print(f"⚠️  Unknown CACHE_BACKEND '{CACHE_BACKEND}', using the in-memory cache")
+    return MemoryCache(CACHE_MAX_ENTRIES)
+
+
+search_cache = SearchCache(create_cache_backend(), CACHE_TTLS, stale_ttl=CACHE_STALE_TTL)
+
+# Background refresh of the most searched queries' cache entries before they expire
+PREWARM_TOP_N = int(os.getenv("PREWARM_TOP_N", 20))  # 0 disables prewarming
+PREWARM_INTERVAL = float(os.getenv("PREWARM_INTERVAL", 60))  # Seconds between cycles
+PREWARM_LEAD_TIME = float(os.getenv("PREWARM_LEAD_TIME", 120))  # Refresh entries expiring within this many seconds
+PREWARM_CALLS_PER_MINUTE = int(os.getenv("PREWARM_CALLS_PER_MINUTE", 30))  # Upstream requests per minute, per process
+
+
+def upstream_calls_for(source: str, key: str) -> int:
+    """Upstream requests one refresh of a cache key costs."""
+    if source == "github":
+        # "github|<query>|<page>|<per_page>|contributors": the search plus one /contributors call per repo
+        *_, page_size, variant = key.rsplit("|", 3)
+        return 1 + int(page_size) if variant == "contributors" else 1
+    if source == "blogs":
+        return max(1, len(REDDIT_SUBREDDITS))  # One search per subreddit
+    if source == "repo_details":
+        return 4  # Repo, README, contributors and languages
+    return 1
+
+
+prewarmer = Prewarmer(
+    search_cache,
+    top_n=PREWARM_TOP_N,
+    interval=PREWARM_INTERVAL,
+    lead_time=PREWARM_LEAD_TIME,
+    calls_per_minute=PREWARM_CALLS_PER_MINUTE,
+    call_cost=upstream_calls_for,
+)
+
+CONTRIBUTOR_CONCURRENCY = int(os.getenv("CONTRIBUTOR_CONCURRENCY", 8))  # Parallel /contributors requests per search
+
+# Scheduled harvest of upstream results into the `resources` table (see harvest.py)
+HARVEST_INTERVAL = float(os.getenv("HARVEST_INTERVAL", 0))  # Seconds between harvests, 0 disables
+HARVEST_QUERIES = [query.strip() for query in os.getenv("HARVEST_QUERIES", ",".join(DEFAULT_SEED_QUERIES)).split(",") if query.strip()]
+HARVEST_PAGES = int(os.getenv("HARVEST_PAGES", 1))
+
+# Per-source time budgets (seconds) for the unified search endpoints
+SOURCE_DEADLINES = {
+    "github": float(os.getenv("GITHUB_DEADLINE", 8)),
+    "research_papers": float(os.getenv("ARXIV_DEADLINE", 8)),
+    "blogs": float(os.getenv("BLOGS_DEADLINE", 5)),
+    "courses": float(os.getenv("COURSES_DEADLINE", 2)),
+    "community": float(os.getenv("COMMUNITY_DEADLINE", 2)),
+}
+
+http_clients = {}
+
+
+def create_http_clients():
+    """Create one pooled, keep-alive AsyncClient per upstream API."""
+    http2 = HTTP2_ENABLED
+    if http2 and importlib.util.find_spec("h2") is None:
+        print("⚠️  HTTP2_ENABLED is set but the 'h2' package is not installed, falling back to HTTP/1.1")
+        http2 = False
+
+    limits = httpx.Limits(
+        max_connections=HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+    )
+
+    http_clients["github"] = httpx.AsyncClient(
+        headers=HEADERS,
+        timeout=GITHUB_TIMEOUT,
+        limits=limits,
+        http2=http2,
+    )
+    http_clients["arxiv"] = httpx.AsyncClient(
+        timeout=ARXIV_TIMEOUT,
+        limits=limits,
+        http2=http2,
+        follow_redirects=True,
+    )
+
+
+async def close_http_clients():
+    """Close all shared upstream clients, releasing their pooled connections."""
+    clients = list(http_clients.values())
+    http_clients.clear()
+    for client in clients:
+        await client.aclose()
+
+
+def get_http_client(name: str) -> httpx.AsyncClient:
+    """Return the shared client for an upstream, creating the pool on first use outside the app lifespan."""
+    if name not in http_clients:
+        create_http_clients()
+    return http_clients[name]
+
+
+# All GitHub API calls go through this, so they share one view of the rate limit and the ETags
+github = GitHubClient(
+    lambda: get_http_client("github"),
+    etag_entries=GITHUB_ETAG_CACHE_SIZE,
+    reserve=GITHUB_RATE_LIMIT_RESERVE,
+    max_wait=GITHUB_RATE_LIMIT_MAX_WAIT,
+)
+
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,
@@ -262,14 +444,41 @@ app.add_middleware(
 CLIENT_SECRET = os.getenv("REDDIT_CLIENT_SECRET")
 CLIENT_ID = os.getenv("REDDIT_CLIENT_ID")
 
+# Comma-separated subreddits searched concurrently for blog posts
+REDDIT_SUBREDDITS = [name.strip() for name in os.getenv("REDDIT_SUBREDDITS", "datascience").split(",") if name.strip()]
 
-reddit = praw.Reddit(
-    client_id=CLIENT_ID,  # Your client_id
-    client_secret=CLIENT_SECRET,  # Your client_secret
-    user_agent="python:ai-hub:v1.0 (by /u/Last_Internet_9156)"  # Your custom user agent
-)
+reddit = None  # asyncpraw client, created in lifespan (it needs a running event loop)
+
+
+def create_reddit_client():
+    global reddit
+    reddit = asyncpraw.Reddit(
+        client_id=CLIENT_ID,  # Your client_id
+        client_secret=CLIENT_SECRET,  # Your client_secret
+        user_agent="python:ai-hub:v1.0 (by /u/Last_Internet_9156)"  # Your custom user agent
+    )
+
+
+async def close_reddit_client():
+    global reddit
+    if reddit is not None:
+        await reddit.close()
+        reddit = None
+
+
+def get_reddit_client() -> asyncpraw.Reddit:
+    """Return the shared Reddit client, creating it on first use outside the app lifespan."""
+    if reddit is None:
+        create_reddit_client()
+    return reddit
 
-openai.api_key = OPENAI_API_KEY
+openai_client = openai.AsyncOpenAI(api_key=OPENAI_API_KEY)
+
+# Chat streaming limits
+CHAT_MAX_CONCURRENT_STREAMS = int(os.getenv("CHAT_MAX_CONCURRENT_STREAMS", 20))
+CHAT_FLUSH_INTERVAL = float(os.getenv("CHAT_FLUSH_INTERVAL", 0.05))  # Seconds to coalesce token deltas into one SSE frame
+
+chat_stream_slots = asyncio.Semaphore(CHAT_MAX_CONCURRENT_STREAMS)
 
 class ChatRequest(BaseModel):
     message: str
@@ -300,6 +509,10 @@ class CommunityUploadCreate(BaseModel):
     resource_type: str  # Should be one of 'GitHub', 'Course', 'Blog', 'Research Paper'
     url: str 
 
+class BulkStatusUpdate(BaseModel):
+    ids: List[int]
+    status: str  # 'approved' or 'rejected'
+
 class CommunityUploadResponse(BaseModel):
     id: int
     title: str
@@ -312,9 +525,138 @@ class CommunityUploadResponse(BaseModel):
     class Config:
         orm_mode = True
 
+class BookmarkPage(BaseModel):
+    items: List[Bookmark]
+    next_cursor: Optional[str] = None  # Pass back as ?cursor= to get the next page
+
+class CommunityUploadPage(BaseModel):
+    items: List[CommunityUploadResponse]
+    next_cursor: Optional[str] = None
+
+class BookmarkSearchResult(Bookmark):
+    rank: float  # ts_rank_cd relevance, higher is better
+
+class CommunityUploadSearchResult(CommunityUploadResponse):
+    rank: float
+
+
+# Keyset pagination on the primary key: every page is an index range scan, however deep
+MAX_PAGE_SIZE = int(os.getenv("MAX_PAGE_SIZE", 100))
+
+
+def encode_cursor(last_id: int) -> str:
+    return base64.urlsafe_b64encode(json.dumps({"id": last_id}).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> int:
+    try:
+        return int(json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))["id"])
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
+async def fetch_page(db: AsyncSession, query, id_column, cursor: Optional[str], limit: int) -> dict:
+    """Run `query` for the page after `cursor`, ordered by `id_column`, capped at MAX_PAGE_SIZE rows."""
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    if cursor:
+        query = query.where(id_column > decode_cursor(cursor))
+
+    # Fetch one extra row to learn whether another page exists
+    result = await db.execute(query.order_by(id_column).limit(limit + 1))
+    rows = result.scalars().all()
+
+    next_cursor = encode_cursor(rows[limit - 1].id) if len(rows) > limit else None
+    return {"items": rows[:limit], "next_cursor": next_cursor}
+
+
+# Full-text search over the generated, GIN-indexed `search_vector` columns
+MAX_SEARCH_RESULTS = int(os.getenv("MAX_SEARCH_RESULTS", 50))
+SEARCH_LANGUAGE = "english"  # Must match the text search config of the generated columns
+
 
-async def fetch_github_repos(query: str, per_page: int = 30, page: int = 1):
-    """Fetch AI repositories from GitHub along with their top contributors (with profile pictures)."""
+async def full_text_search(db: AsyncSession, model, query, q: str, limit: int, offset: int = 0) -> list:
+    """
+    Run `query` for rows of `model` matching `q`, best first, as (row, rank) pairs.
+    Off Postgres (e.g. SQLite in development) falls back to unranked substring matching.
+    """
+    limit = max(1, min(limit, MAX_SEARCH_RESULTS))
+    if db.get_bind().dialect.name == "postgresql":
+        search_vector = literal_column(f"{model.__tablename__}.search_vector")
+        ts_query = func.websearch_to_tsquery(SEARCH_LANGUAGE, q)
+        rank = func.ts_rank_cd(search_vector, ts_query)
+        query = query.add_columns(rank).where(search_vector.op("@@")(ts_query)).order_by(rank.desc(), model.id)
+    else:
+        pattern = f"%{q}%"
+        query = query.add_columns(literal(0.0)).where(
+            or_(model.title.ilike(pattern), model.description.ilike(pattern))
+        ).order_by(model.id)
+
+    result = await db.execute(query.limit(limit).offset(offset))
+    return result.all()
+
+
+def with_rank(row, rank: float) -> dict:
+    """An ORM row's column values plus its search rank."""
+    return {**{column.key: getattr(row, column.key) for column in sa_inspect(row).mapper.column_attrs}, "rank": rank}
+
+
+async def fetch_contributors(owner: str, repo_name: str, semaphore: asyncio.Semaphore, rate_limited: asyncio.Event):
+    """Fetch the top 3 contributors (including profile pictures) of a repository."""
+    async with semaphore:
+        if rate_limited.is_set():
+            return []  # Stop fetching further contributors to avoid API blocking
+
+        contributors_url = f"https://api.github.com/repos/{owner}/{repo_name}/contributors"
+        try:
+            contrib_response = await github.get(contributors_url, params={"per_page": 3})
+
+            if contrib_response.status_code in (403, 429):
+                print("GitHub API rate limit reached while fetching contributors.")
+                rate_limited.set()
+                return []
+
+            if contrib_response.status_code == 204:
+                print(f"No contributors found for {repo_name}.")  # Debugging
+                return []  # No content, so keep contributors empty
+
+            if contrib_response.status_code == 200:
+                return [
+                    {
+                        "username": user.get("login", "Unknown"),
+                        "contributions": user.get("contributions", 0),
+                        "avatar_url": user.get("avatar_url", "")
+                    }
+                    for user in contrib_response.json()
+                ]
+
+            print(f"Error fetching contributors for {repo_name}: {contrib_response.status_code}, {contrib_response.text}")
+
+        except GitHubRateLimited as e:
+            print(f"Skipping remaining contributors: {e}")
+            rate_limited.set()
+        except httpx.RequestError as e:
+            print(f"Network error while fetching contributors for {repo_name}: {e}")
+        except Exception as e:
+            print(f"Unexpected error while fetching contributors for {repo_name}: {e}")
+
+        return []
+
+
+async def enrich_with_contributors(repositories: List[dict]):
+    """Attach top contributors to each repository, fetching at most CONTRIBUTOR_CONCURRENCY at a time."""
+    semaphore = asyncio.Semaphore(CONTRIBUTOR_CONCURRENCY)
+    rate_limited = asyncio.Event()
+
+    contributors = await asyncio.gather(*(
+        fetch_contributors(repo["owner"], repo["name"], semaphore, rate_limited)
+        for repo in repositories
+    ))
+    for repo, repo_contributors in zip(repositories, contributors):
+        repo["contributors"] = repo_contributors
+
+
+async def fetch_github_repos(query: str, per_page: int = 30, page: int = 1, include_contributors: bool = True):
+    """Fetch AI repositories from GitHub, optionally with their top contributors (with profile pictures)."""
     params = {
         "q": query,
         "sort": "stars",
@@ -323,74 +665,105 @@ async def fetch_github_repos(query: str, per_page: int = 30, page: int = 1):
         "per_page": per_page
     }
 
-    async with httpx.AsyncClient() as client:
-        try:
-            # Fetch repositories
-            response = await client.get(GITHUB_API_URL, params=params, headers=HEADERS)
+    try:
+        # Fetch repositories
+        response = await github.get(GITHUB_API_URL, params=params)
 
-            if response.status_code == 403:
-                raise HTTPException(status_code=403, detail="GitHub API rate limit exceeded. Try again later.")
+        if response.status_code in (403, 429):
+            raise HTTPException(status_code=403, detail="GitHub API rate limit exceeded. Try again later.")
 
-            if response.status_code != 200:
-                raise HTTPException(status_code=response.status_code, detail=f"GitHub API Error: {response.text}")
-
-            data = response.json()
-            repositories = []
-
-            for repo in data.get("items", []):
-                owner, repo_name = repo["owner"]["login"], repo["name"]
-                contributors_url = f"https://api.github.com/repos/{owner}/{repo_name}/contributors"
-
-                # Fetch top 3 contributors (including profile pictures)
-                contributors = []
-                try:
-                    contrib_response = await client.get(contributors_url, params={"per_page": 3}, headers=HEADERS)
-
-                    if contrib_response.status_code == 403:
-                        print("GitHub API rate limit reached while fetching contributors.")
-                        break  # Stop fetching further contributors to avoid API blocking
-
-                    if contrib_response.status_code == 204:
-                        print(f"No contributors found for {repo_name}.")  # Debugging
-                        contributors = []  # No content, so keep contributors empty
-
-                    elif contrib_response.status_code == 200:
-                        contributors = [
-                            {
-                                "username": user.get("login", "Unknown"),
-                                "contributions": user.get("contributions", 0),
-                                "avatar_url": user.get("avatar_url", "")
-                            }
-                            for user in contrib_response.json()
-                        ]
-
-                    else:
-                        print(f"Error fetching contributors for {repo_name}: {contrib_response.status_code}, {contrib_response.text}")
-
-                except httpx.RequestError as e:
-                    print(f"Network error while fetching contributors for {repo_name}: {e}")
-                except Exception as e:
-                    print(f"Unexpected error while fetching contributors for {repo_name}: {e}")
-
-                repositories.append({
-                    "resource_type": "github",
-                    "name": repo["name"],
-                    "owner": repo["owner"]["login"],
-                    "full_name": repo["full_name"],
-                    "description": repo.get("description", "No description available"),
-                    "stars": repo["stargazers_count"],
-                    "url": repo["html_url"],
-                    "language": repo.get("language", "Unknown"),
-                    "contributors": contributors
-                })
-
-            return repositories
+        if response.status_code != 200:
+            raise HTTPException(status_code=response.status_code, detail=f"GitHub API Error: {response.text}")
+
+        data = response.json()
+        repositories = [
+            {
+                "resource_type": "github",
+                "name": repo["name"],
+                "owner": repo["owner"]["login"],
+                "full_name": repo["full_name"],
+                "description": repo.get("description", "No description available"),
+                "stars": repo["stargazers_count"],
+                "url": repo["html_url"],
+                "language": repo.get("language", "Unknown"),
+                "contributors": []
+            }
+            for repo in data.get("items", [])
+        ]
 
-        except httpx.RequestError as e:
-            raise HTTPException(status_code=500, detail=f"Network error while fetching GitHub repositories: {e}")
+        # List views can skip the per-repo contributor requests entirely
+        if include_contributors:
+            await enrich_with_contributors(repositories)
 
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"Unexpected error occurred: {e}")
+        return repositories
+
+    except GitHubRateLimited as e:
+        raise HTTPException(status_code=403, detail=f"GitHub API rate limit exceeded. Try again later. ({e})")
+
+    except httpx.RequestError as e:
+        raise HTTPException(status_code=500, detail=f"Network error while fetching GitHub repositories: {e}")
+
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Unexpected error occurred: {e}")
+
+
+# Atom tags used by the arXiv feed, resolved once instead of per entry
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
+ATOM_ENTRY = ATOM_NS + "entry"
+ATOM_TITLE = ATOM_NS + "title"
+ATOM_SUMMARY = ATOM_NS + "summary"
+ATOM_ID = ATOM_NS + "id"
+ATOM_PUBLISHED = ATOM_NS + "published"
+ATOM_AUTHOR = ATOM_NS + "author"
+ATOM_NAME = ATOM_NS + "name"
+
+
+def parse_arxiv_entry(entry: ET.Element) -> dict:
+    """Convert a completed Atom <entry> into a paper dict in a single pass over its children."""
+    paper = {
+        "resource_type": "arxiv paper",
+        "title": None,
+        "summary": None,
+        "link": None,
+        "authors": [],
+        "published_date": None
+    }
+    for child in entry:
+        if child.tag == ATOM_TITLE:
+            paper["title"] = child.text
+        elif child.tag == ATOM_SUMMARY:
+            paper["summary"] = child.text
+        elif child.tag == ATOM_ID:
+            paper["link"] = child.text
+        elif child.tag == ATOM_PUBLISHED:
+            paper["published_date"] = child.text
+        elif child.tag == ATOM_AUTHOR:
+            name = child.find(ATOM_NAME)
+            if name is not None:
+                paper["authors"].append(name.text)
+    return paper
+
+
+async def stream_arxiv_entries(response: httpx.Response):
+    """
+    Incrementally parse an arXiv Atom feed from the response bytes, yielding papers
+    as their <entry> elements complete and dropping finished elements from the tree.
+    """
+    parser = ET.XMLPullParser(events=("start", "end"))
+    feed = None
+
+    async for chunk in response.aiter_bytes():
+        parser.feed(chunk)
+        for event, elem in parser.read_events():
+            if event == "start":
+                if feed is None:
+                    feed = elem  # Root <feed>, kept only so finished entries can be released
+                continue
+            if elem.tag == ATOM_ENTRY:
+                yield parse_arxiv_entry(elem)
+                feed.clear()
+
+    parser.close()
 
 
 async def fetch_arxiv_papers(query: str, max_results: int = 30, page: int = 1):
@@ -404,31 +777,14 @@ async def fetch_arxiv_papers(query: str, max_results: int = 30, page: int = 1):
     }
 
     try:
-        async with httpx.AsyncClient(timeout=15.0, follow_redirects=True) as client:
-            response = await client.get(ARXIV_API_URL, params=params)
-        
-        if response.status_code != 200:
-            print(f"arXiv API returned status {response.status_code}: {response.text[:200]}")
-            raise HTTPException(status_code=response.status_code, detail=f"Failed to fetch arXiv data: {response.status_code}")
-
-        root = ET.fromstring(response.text)
-        papers = []
-        for entry in root.findall("{http://www.w3.org/2005/Atom}entry"):
-            title = entry.find("{http://www.w3.org/2005/Atom}title").text
-            summary = entry.find("{http://www.w3.org/2005/Atom}summary").text
-            link = entry.find("{http://www.w3.org/2005/Atom}id").text
-            authors = [author.find("{http://www.w3.org/2005/Atom}name").text for author in entry.findall("{http://www.w3.org/2005/Atom}author")]
-            published_date = entry.find("{http://www.w3.org/2005/Atom}published").text 
-
-            papers.append({
-                "resource_type": "arxiv paper",
-                "title": title,
-                "summary": summary,
-                "link": link,
-                "authors": authors,
-                "published_date": published_date
-            })
-        return papers
+        client = get_http_client("arxiv")
+        async with client.stream("GET", ARXIV_API_URL, params=params) as response:
+            if response.status_code != 200:
+                await response.aread()
+                print(f"arXiv API returned status {response.status_code}: {response.text[:200]}")
+                raise HTTPException(status_code=response.status_code, detail=f"Failed to fetch arXiv data: {response.status_code}")
+
+            return [paper async for paper in stream_arxiv_entries(response)]
     except httpx.RequestError as e:
         print(f"Network error while fetching arXiv papers: {e}")
         raise HTTPException(status_code=500, detail=f"Network error while fetching arXiv data: {str(e)}")
@@ -442,19 +798,40 @@ async def fetch_arxiv_papers(query: str, max_results: int = 30, page: int = 1):
 
 
 
-async def fetch_blogs(query: str, max_results: int = 5):
+async def search_subreddit(name: str, query: str, max_results: int):
+    """Search a single subreddit for posts matching the query."""
     try:
-        # Search Reddit for posts matching the query in relevant subreddits
-        search_results = reddit.subreddit("datascience").search(query, limit=max_results)
-
-        filtered_posts = []
-        for submission in search_results:
-            filtered_posts.append({
+        subreddit = await get_reddit_client().subreddit(name)
+        return [
+            {
                 'resource_type': "blog",
                 'title': submission.title,
                 'url': submission.url,
                 'description': submission.selftext if submission.selftext else "No summary available"
-            })
+            }
+            async for submission in subreddit.search(query, limit=max_results)
+        ]
+    except Exception as e:
+        print(f"Error fetching blogs from r/{name}: {e}")
+        return []
+
+
+async def fetch_blogs(query: str, max_results: int = 5):
+    """Search Reddit for posts matching the query in all configured subreddits at once."""
+    try:
+        per_subreddit = await asyncio.gather(*(
+            search_subreddit(name, query, max_results) for name in REDDIT_SUBREDDITS
+        ))
+
+        # Interleave subreddits so one busy community doesn't crowd out the rest
+        filtered_posts = []
+        seen_urls = set()
+        for rank in range(max_results):
+            for posts in per_subreddit:
+                if rank < len(posts) and posts[rank]["url"] not in seen_urls:
+                    seen_urls.add(posts[rank]["url"])
+                    filtered_posts.append(posts[rank])
+        filtered_posts = filtered_posts[:max_results]
 
         if not filtered_posts:
             print(f"No blog posts matched query: {query}")
@@ -467,20 +844,11 @@ async def fetch_blogs(query: str, max_results: int = 5):
 
 
 
-async def fetch_coursera_courses(query: str, max_results: int = 10, page: int = 1):
+async def fetch_coursera_courses(query: str, max_results: int = 10, page: int = 1, mode: str = "and"):
     """Fetch AI-related courses from curated list with search filtering."""
     try:
-        # Convert query to lowercase for matching
-        query_lower = query.lower()
-        
-        # Filter courses based on query matching title, description, and platform
-        filtered_courses = [
-            course for course in AI_COURSES
-            if query_lower in course.get("title", "").lower() or
-               query_lower in course.get("description", "").lower() or
-               query_lower in course.get("platform", "").lower() or
-               query_lower in course.get("author", "").lower()
-        ]
+        # Look the query terms up in the course index (title, description, platform and author)
+        filtered_courses = course_index.search(query, mode=mode)
         
         # If no courses match, return all courses (better UX than empty list)
         if not filtered_courses:
@@ -506,12 +874,102 @@ async def fetch_coursera_courses(query: str, max_results: int = 10, page: int =
 
 
 
+async def in_own_session(search, *args):
+    """Run `search(db, *args)` in a dedicated session, so concurrent sources never share one."""
+    async with SessionLocal() as db:
+        return await search(db, *args)
+
+
+async def search_community_uploads(db: AsyncSession, query: str, max_results: int):
+    """Approved community uploads matching the query, shaped like the upstream sources' results. No network call."""
+    rows = await full_text_search(
+        db,
+        models.CommunityUpload,
+        select(models.CommunityUpload).where(models.CommunityUpload.status == "approved"),
+        query,
+        max_results,
+    )
+    return [
+        {
+            "id": upload.id,
+            "title": upload.title,
+            "description": upload.description,
+            "url": upload.url,
+            "upload_type": upload.resource_type,
+            "resource_type": "community",
+        }
+        for upload, _ in rows
+    ]
+
+
+# Upstream source -> resource_type of its harvested rows in the `resources` table
+LOCAL_RESOURCE_TYPES = {"github": "github", "research_papers": "arxiv paper", "blogs": "blog"}
+
+
+async def search_local_resources(db: AsyncSession, query: str, resource_type: str, max_results: int, page: int = 1):
+    """Harvested resources of one type matching the query, in the same dict shape the live fetchers return."""
+    rows = await full_text_search(
+        db,
+        models.Resource,
+        select(models.Resource).where(models.Resource.resource_type == resource_type),
+        query,
+        max_results,
+        offset=(page - 1) * max_results,
+    )
+    return [resource.data for resource, _ in rows]
+
+
+def wants_fresh(cache_control: Optional[str]) -> bool:
+    """True when the client asked to bypass caches with Cache-Control: no-cache."""
+    return cache_control is not None and "no-cache" in cache_control.lower()
+
+
+# Cached entry points for the upstream sources, used by the routes below
+async def search_github(query: str, per_page: int, page: int = 1, include_contributors: bool = True, no_cache: bool = False):
+    return await search_cache.fetch(
+        "github", query, page, per_page,
+        lambda: fetch_github_repos(query, per_page=per_page, page=page, include_contributors=include_contributors),
+        bypass=no_cache,
+        variant="contributors" if include_contributors else None,
+    )
+
+
+async def search_arxiv(query: str, max_results: int, page: int = 1, no_cache: bool = False):
+    return await search_cache.fetch(
+        "research_papers", query, page, max_results,
+        lambda: fetch_arxiv_papers(query, max_results=max_results, page=page),
+        bypass=no_cache,
+    )
+
+
+async def search_blogs(query: str, max_results: int, no_cache: bool = False):
+    return await search_cache.fetch(
+        "blogs", query, 1, max_results,
+        lambda: fetch_blogs(query, max_results=max_results),
+        bypass=no_cache,
+    )
+
+
+def search_source(name: str, query: str, limit: int, page: int, include_contributors: bool, no_cache: bool,
+                  local: bool = False):
+    """Search GitHub, arXiv or Reddit live (through the cache), or their harvested rows when `local`."""
+    if local:
+        return in_own_session(search_local_resources, query, LOCAL_RESOURCE_TYPES[name], limit, page)
+    if name == "github":
+        return search_github(query, limit, page, include_contributors, no_cache=no_cache)
+    if name == "research_papers":
+        return search_arxiv(query, limit, page, no_cache=no_cache)
+    return search_blogs(query, limit, no_cache=no_cache)  # Fetch blogs from Reddit
+
+
 @app.get("/search-ai-repos")
 async def search_ai_repositories(q: str = Query(..., title="Search Query"),
     max_results: int = Query(10, title="Max Results Per Page"),
-    page: int = Query(1, title="Page Number")):
+    page: int = Query(1, title="Page Number"),
+    include_contributors: bool = Query(True, title="Include Top Contributors"),
+    cache_control: Optional[str] = Header(None)):
     """Route for fetching AI repositories from GitHub."""
-    repos = await fetch_github_repos(q, per_page=max_results, page=page)
+    repos = await search_github(q, max_results, page, include_contributors, no_cache=wants_fresh(cache_control))
     return {
         "page": page,
         "max_results": max_results,
@@ -523,10 +981,11 @@ async def search_ai_repositories(q: str = Query(..., title="Search Query"),
 async def search_arxiv_papers(
     q: str = Query(..., title="Search Query"), 
     max_results: int = Query(10, title="Max Results Per Page"),
-    page: int = Query(1, title="Page Number")
+    page: int = Query(1, title="Page Number"),
+    cache_control: Optional[str] = Header(None)
 ):
     """Route for fetching AI research papers from arXiv with pagination."""
-    papers = await fetch_arxiv_papers(q, max_results, page)
+    papers = await search_arxiv(q, max_results, page, no_cache=wants_fresh(cache_control))
     
     return {
         "page": page,
@@ -538,9 +997,10 @@ async def search_arxiv_papers(
 async def search_arxiv_papers(
     q: str = Query(..., title="Search Query"), 
     max_results: int = Query(10, title="Max Results Per Page"),
+    cache_control: Optional[str] = Header(None)
 ):
     """Route for fetching AI research papers from arXiv with pagination."""
-    papers =  await fetch_blogs(q, max_results)
+    papers =  await search_blogs(q, max_results, no_cache=wants_fresh(cache_control))
     
     return {
         "max_results": max_results,
@@ -548,89 +1008,65 @@ async def search_arxiv_papers(
     }
 
 @app.get("/get-resources")
-async def get_resources(q: str = Query(..., title="Search Query"), max_results: int = 50):
+async def get_resources(q: str = Query(..., title="Search Query"), max_results: int = 50,
+                        cache_control: Optional[str] = Header(None)):
     """
     Fetch both GitHub repositories and arXiv research papers for the given query.
     Returns a JSON object containing both types of resources.
     """
     try:
-        github_repos, arxiv_papers = await fetch_github_repos(q, max_results), await fetch_arxiv_papers(q, max_results)
+        no_cache = wants_fresh(cache_control)
+        github_repos, arxiv_papers = await search_github(q, max_results, no_cache=no_cache), await search_arxiv(q, max_results, no_cache=no_cache)
         return {"repositories": github_repos, "arxivPapers": arxiv_papers}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch resources: {str(e)}")
 
 
 @app.get("/repo-details")
-async def get_repo_details(owner: str, repo: str):
+async def get_repo_details(owner: str, repo: str, cache_control: Optional[str] = Header(None)):
     """
     Fetch detailed information about a GitHub repository.
     """
-    async with httpx.AsyncClient() as client:
-        try:
-            # Fetch repository details
-            repo_response = await client.get(f"{GITHUB_API_BASE_URL}/{owner}/{repo}", headers=HEADERS)
-            if repo_response.status_code != 200:
-                raise HTTPException(status_code=repo_response.status_code, detail="Failed to fetch repo details")
-
-            # Fetch README
-            readme_response = await client.get(f"{GITHUB_API_BASE_URL}/{owner}/{repo}/readme", headers=HEADERS)
-            readme_content = readme_response.json().get("content", "") if readme_response.status_code == 200 else ""
-
-            # Fetch contributors
-            contributors_response = await client.get(f"{GITHUB_API_BASE_URL}/{owner}/{repo}/contributors", headers=HEADERS)
-            contributors = [
-                {
-                    "login": c["login"],
-                    "avatar_url": c["avatar_url"],
-                    "contributions": c["contributions"]
-                } for c in contributors_response.json() if contributors_response.status_code == 200
-            ]
-
-            # Fetch languages
-            languages_response = await client.get(f"{GITHUB_API_BASE_URL}/{owner}/{repo}/languages", headers=HEADERS)
-            languages = list(languages_response.json().keys()) if languages_response.status_code == 200 else []
-
-            return {
-                "repo": repo_response.json(),
-                "readme": readme_content,
-                "contributors": contributors,
-                "languages": languages
-            }
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"Error fetching repo details: {str(e)}")
-
-def rank_results(query: str, resources: List[dict] = None) -> List[dict]:
-    if resources is None or len(resources) == 0:
-        return []
-    query = query.lower().strip()
-
-    # Extract titles and descriptions
-    resource_texts = [
-        (resource.get("title") or resource.get("name") or "") + " " + 
-        (resource.get("summary") or resource.get("description") or "")
-        for resource in resources
-    ]
-
-    # Include query in the list for comparison
-    all_texts = [query] + resource_texts
-
-    # Convert text into TF-IDF vectors
-    vectorizer = TfidfVectorizer(stop_words="english")
-    tfidf_matrix = vectorizer.fit_transform(all_texts)
-
-    # Compute cosine similarity between query and resources
-    query_vector = tfidf_matrix[0]  # The first vector is the query
-    resource_vectors = tfidf_matrix[1:]  # Remaining vectors are resource texts
+    return await search_cache.fetch(
+        "repo_details", f"{owner}/{repo}", 1, 1,
+        lambda: fetch_repo_details(owner, repo),
+        bypass=wants_fresh(cache_control),
+    )
 
-    similarities = cosine_similarity(query_vector, resource_vectors).flatten()
 
-    # Attach scores to resources and sort by similarity
-    for i, resource in enumerate(resources):
-        resource["similarity_score"] = similarities[i]
+async def fetch_repo_details(owner: str, repo: str):
+    try:
+        # Fetch repository details
+        repo_response = await github.get(f"{GITHUB_API_BASE_URL}/{owner}/{repo}")
+        if repo_response.status_code != 200:
+            raise HTTPException(status_code=repo_response.status_code, detail="Failed to fetch repo details")
+
+        # Fetch README
+        readme_response = await github.get(f"{GITHUB_API_BASE_URL}/{owner}/{repo}/readme")
+        readme_content = readme_response.json().get("content", "") if readme_response.status_code == 200 else ""
+
+        # Fetch contributors
+        contributors_response = await github.get(f"{GITHUB_API_BASE_URL}/{owner}/{repo}/contributors")
+        contributors = [
+            {
+                "login": c["login"],
+                "avatar_url": c["avatar_url"],
+                "contributions": c["contributions"]
+            } for c in contributors_response.json() if contributors_response.status_code == 200
+        ]
 
-    ranked_resources = sorted(resources, key=lambda x: x["similarity_score"], reverse=True)
+        # Fetch languages
+        languages_response = await github.get(f"{GITHUB_API_BASE_URL}/{owner}/{repo}/languages")
+        languages = list(languages_response.json().keys()) if languages_response.status_code == 200 else []
 
-    return ranked_resources
+        return {
+            "repo": repo_response.json(),
+            "readme": readme_content,
+            "contributors": contributors,
+            "languages": languages
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching repo details: {str(e)}")
 
 # @app.get("/v2-get-resources")
 # async def v2_get_resources(
@@ -643,7 +1079,7 @@ def rank_results(query: str, resources: List[dict] = None) -> List[dict]:
 #         arxiv_papers = await fetch_arxiv_papers(q, max_results=30)  # Increase arXiv fetch limit
 
 #         all_results = github_repos + arxiv_papers
-#         ranked_results = rank_results(q, all_results)
+#         ranked_results = rank_results(q, all_results, top_k=max_results)
 
 #         start_idx = (page - 1) * max_results
 #         end_idx = start_idx + max_results
@@ -659,51 +1095,86 @@ def rank_results(query: str, resources: List[dict] = None) -> List[dict]:
 #         raise HTTPException(status_code=500, detail=f"Failed to fetch and rank resources: {str(e)}")
 
 
+async def run_source(name: str, coro):
+    """Await a single source under its deadline and report how it went."""
+    started = time.perf_counter()
+    try:
+        results = await asyncio.wait_for(coro, timeout=SOURCE_DEADLINES.get(name))
+        source_status = "ok"
+    except asyncio.TimeoutError:
+        print(f"Source '{name}' missed its {SOURCE_DEADLINES.get(name)}s deadline")
+        results, source_status = [], "timeout"
+    except Exception as e:
+        print(f"Error fetching {name}:", e)
+        results, source_status = [], "error"
+
+    elapsed_ms = round((time.perf_counter() - started) * 1000, 1)
+    return name, results, {"status": source_status, "elapsed_ms": elapsed_ms}
+
+
+async def fan_out(sources: dict):
+    """
+    Query all sources concurrently, each under its own deadline.
+    Returns the results per source and a status block (ok/timeout/error + elapsed ms).
+    """
+    outcomes = await asyncio.gather(*(run_source(name, coro) for name, coro in sources.items()))
+    results = {name: items for name, items, _ in outcomes}
+    statuses = {name: source_status for name, _, source_status in outcomes}
+    return results, statuses
+
+
+def v2_source_calls(q: str, max_results: int, page: int, include_contributors: bool, no_cache: bool, local: bool):
+    """
+    The per-source lookups behind one /v2-get-resources page, as {source name: coroutine}.
+    Community uploads aren't paged, so only page 1 includes them.
+    """
+    # Split max_results between GitHub, arXiv, and Blogs
+    github_limit = max_results // 4
+    arxiv_limit = max_results // 4
+    blogs_limit = max_results // 4
+    courses_limit = max_results - (github_limit + arxiv_limit + blogs_limit)
+    community_limit = max(1, max_results // 4)  # Local, so cheap extra candidates for the ranker
+
+    # Fetch only required results for the requested page
+    source_calls = {
+        "github": search_source("github", q, github_limit, page, include_contributors, no_cache, local),
+        "research_papers": search_source("research_papers", q, arxiv_limit, page, include_contributors, no_cache, local),
+        "blogs": search_source("blogs", q, blogs_limit, page, include_contributors, no_cache, local),
+        "courses": fetch_coursera_courses(query=q, max_results=courses_limit, page=page),
+    }
+    if page == 1:
+        source_calls["community"] = in_own_session(search_community_uploads, q, community_limit)
+    return source_calls
+
+
 @app.get("/v2-get-resources")
 async def v2_get_resources(
     q: str = Query(..., title="Search Query"), 
     max_results: int = 20,   # Number of results per page
-    page: int = 1
+    page: int = 1,
+    include_contributors: bool = True,
+    source: str = Query("live", pattern="^(live|local)$", title="Query upstream APIs (live) or harvested resources (local)"),
+    cache_control: Optional[str] = Header(None)
 ):
     try:
-        # Split max_results between GitHub, arXiv, and Blogs
-        github_limit = max_results // 4
-        arxiv_limit = max_results // 4
-        blogs_limit = max_results // 4
-        courses_limit = max_results - (github_limit + arxiv_limit + blogs_limit)
-
-        # Fetch only required results for the requested page
-        try:
-            github_repos = await fetch_github_repos(q, per_page=github_limit, page=page)
-        except Exception as e:
-            print("Error fetching GitHub repos:", e)
-            github_repos = []
+        no_cache = wants_fresh(cache_control)
 
-        try:
-            arxiv_papers = await fetch_arxiv_papers(q, max_results=arxiv_limit, page=page)
-        except Exception as e:
-            print("Error fetching Arxiv papers:", e)
-            arxiv_papers = []
-
-        try:
-            blogs = await fetch_blogs(q, max_results=blogs_limit)  # Fetch blogs from Towards Data Science
-        except Exception as e:
-            print("Error fetching Blogs:", e)
-            blogs = []
+        # All sources at once
+        results, sources = await fan_out(v2_source_calls(
+            q, max_results, page, include_contributors, no_cache, local=source == "local"
+        ))
 
-        try:
-            courses = await fetch_coursera_courses(query=q, max_results=courses_limit, page=page)
-        except Exception as e:
-            print("Error fetching courses:", e)
-            courses = []
-
-        all_results = github_repos + arxiv_papers + blogs + courses + AI_HANDBOOKS
-        ranked_results = rank_results(q, all_results)
+        all_results = (
+            results["github"] + results["research_papers"] + results["blogs"] + results["courses"]
+            + results.get("community", []) + AI_HANDBOOKS
+        )
+        ranked_results = rank_results(q, all_results, top_k=max_results)
 
         return {
             "results": ranked_results,
             "page": page,
             "max_results": max_results,
+            "sources": sources,
         }
 
 
@@ -719,59 +1190,106 @@ async def v2_get_resources(
 
 
 
+@app.get("/v2-get-resources/stream")
+async def v2_stream_resources(
+    q: str = Query(..., title="Search Query"),
+    max_results: int = 20,
+    page: int = 1,
+    include_contributors: bool = True,
+    source: str = Query("live", pattern="^(live|local)$", title="Query upstream APIs (live) or harvested resources (local)"),
+    cache_control: Optional[str] = Header(None)
+):
+    """
+    Server-Sent Events version of /v2-get-resources. Sends a `source` event with each source's
+    results as soon as that source finishes, then a `ranked` event with the final ordering.
+    """
+    source_calls = v2_source_calls(
+        q, max_results, page, include_contributors, wants_fresh(cache_control), local=source == "local"
+    )
+
+    async def stream_events():
+        tasks = [asyncio.ensure_future(run_source(name, coro)) for name, coro in source_calls.items()]
+        try:
+            collected, sources = [], {}
+            for next_finished in asyncio.as_completed(tasks):
+                name, items, source_status = await next_finished
+                collected += items
+                sources[name] = source_status
+                yield {
+                    "event": "source",
+                    "data": json.dumps({"source": name, "results": items, **source_status}, default=str),
+                }
+
+            ranked_results = rank_results(q, collected + AI_HANDBOOKS, top_k=max_results)
+            yield {
+                "event": "ranked",
+                "data": json.dumps({
+                    "results": ranked_results,
+                    "page": page,
+                    "max_results": max_results,
+                    "sources": sources,
+                }, default=str),
+            }
+        finally:
+            # Client went away: stop waiting on the remaining sources (shared cache loads still finish)
+            for task in tasks:
+                task.cancel()
+
+    return EventSourceResponse(stream_events())
+
+
 @app.get("/get-filtered-resources")
 async def get_filtered_resources(
     q: str = Query(..., title="Search Query"),
     filters: str = Query("", title="Filter Categories"),  # Comma-separated filters
     max_results: int = 10,
-    page: int = 1
+    page: int = 1,
+    include_contributors: bool = True,
+    source: str = Query("live", pattern="^(live|local)$", title="Query upstream APIs (live) or harvested resources (local)"),
+    cache_control: Optional[str] = Header(None)
 ):
     try:
-        available_filters = ["github", "research_papers", "blogs", "courses", "handbook"]
+        no_cache = wants_fresh(cache_control)
+        local = source == "local"
+        available_filters = ["github", "research_papers", "blogs", "courses", "handbook", "community"]
         selected_filters = filters.split(",") if filters else available_filters  # Apply all filters if none are selected
 
-        github_repos = []
-        arxiv_papers = []
-        blogs = []
-        courses = []
         handbooks = []
 
-        # Compute resource limits correctly
-        source_count = len(selected_filters)
-        per_source_limit = max_results // source_count
-        remainder = max_results % source_count
-
-        if "github" in selected_filters:
-            github_repos = await fetch_github_repos(q, per_page=per_source_limit + (1 if remainder > 0 else 0), page=page)
-            remainder -= 1  # Distribute remainder fairly
-
-        if "research_papers" in selected_filters:
-            try:
-                arxiv_papers = await fetch_arxiv_papers(q, max_results=per_source_limit + (1 if remainder > 0 else 0), page=page)
-            except httpx.ReadTimeout:
-                print("Timeout occurred while fetching ArXiv papers")
-                arxiv_papers = [] 
-
-        if "blogs" in selected_filters:
-            blogs = await fetch_blogs(q, max_results=per_source_limit + (1 if remainder > 0 else 0))
-
-        if "courses" in selected_filters:
-            try:
-                courses = await fetch_coursera_courses(q, max_results=per_source_limit + (1 if remainder > 0 else 0), page=page)
-            except httpx.ReadTimeout:
-                print("Timeout occurred while fetching ArXiv papers")
-                courses = [] 
+        # Split max_results over the sources that run for this page (handbooks are a fixed list,
+        # community uploads only fill page 1); earlier sources take the remainder
+        limited_sources = [
+            name for name in ("github", "research_papers", "blogs", "courses", "community")
+            if name in selected_filters and (name != "community" or page == 1)
+        ]
+        per_source_limit, remainder = divmod(max_results, len(limited_sources) or 1)
+        limits = {name: per_source_limit + (1 if i < remainder else 0) for i, name in enumerate(limited_sources)}
+
+        sources = {}
+        for name in ("github", "research_papers", "blogs"):
+            if name in limits:
+                sources[name] = search_source(name, q, limits[name], page, include_contributors, no_cache, local)
+
+        if "courses" in limits:
+            sources["courses"] = fetch_coursera_courses(q, max_results=limits["courses"], page=page)
+
         if "handbook" in selected_filters:
             handbooks = AI_HANDBOOKS if page == 1 else []
 
-        all_results = github_repos + arxiv_papers + blogs + courses + handbooks
+        if "community" in limits:
+            sources["community"] = in_own_session(search_community_uploads, q, limits["community"])
+
+        results, source_statuses = await fan_out(sources)
+
+        all_results = [item for name in sources for item in results[name]] + handbooks
      
-        ranked_results = rank_results(q, all_results)
+        ranked_results = rank_results(q, all_results, top_k=max_results)
 
         return {
             "results": ranked_results,
             "page": page,
             "max_results": max_results,
+            "sources": source_statuses,
         }
 
     except Exception as e:
@@ -804,9 +1322,22 @@ async def chatbot(query: ChatRequest):
         )
 
     # Otherwise, use OpenAI API
+    if chat_stream_slots.locked():
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Too many active chats. Try again shortly.")
+    # Take the slot before responding: a free semaphore is acquired without yielding, so no other request slips in
+    await chat_stream_slots.acquire()
+    released = False
+
+    def release_slot():
+        nonlocal released
+        if not released:
+            released = True
+            chat_stream_slots.release()
+
     async def stream_response():
+        response_stream = None
         try:
-            response_stream = openai.chat.completions.create(
+            response_stream = await openai_client.chat.completions.create(
                 model="gpt-4o-mini",
                 messages=[
                     {"role": "system", "content": "You are a helpful AI assistant."},
@@ -814,60 +1345,84 @@ async def chatbot(query: ChatRequest):
                 ],
                 stream=True  # Enable streaming
             )
-            
-            for chunk in response_stream:
+
+            # Coalesce small token deltas into fewer SSE frames
+            pending = []
+            last_flush = time.monotonic()
+            async for chunk in response_stream:
                 if chunk.choices and len(chunk.choices) > 0:
                     content = chunk.choices[0].delta.content
                     if content:
-                        yield f"data: {content}\n\n"
-                        
+                        pending.append(content)
+
+                if pending and time.monotonic() - last_flush >= CHAT_FLUSH_INTERVAL:
+                    yield f"data: {''.join(pending)}\n\n"
+                    pending.clear()
+                    last_flush = time.monotonic()
+
+            if pending:
+                yield f"data: {''.join(pending)}\n\n"
             yield "data: [DONE]\n\n"
-            
+
         except Exception as e:
             yield f"data: Error: {str(e)}\n\n"
-            
+
+        finally:
+            # Runs on completion and when the SSE client disconnects, so the upstream stream stops too
+            release_slot()
+            if response_stream is not None:
+                with anyio.CancelScope(shield=True):
+                    await response_stream.close()
+
     return StreamingResponse(
         stream_response(),
+        # Also frees the slot if the response ends before the generator ever starts
+        background=BackgroundTask(release_slot),
         media_type="text/event-stream"
     )
 
 
 @app.post("/signup")
-async def signup(request: SignupRequest, db: Session = Depends(get_db)):
+async def signup(request: SignupRequest, db: AsyncSession = Depends(get_db)):
     # Check if user already exists
-    db_user = db.query(User).filter(User.email == request.email).first()
+    result = await db.execute(select(User).where(User.email == request.email))
+    db_user = result.scalars().first()
     if db_user:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Email already registered")
 
     # Create new user
-    hashed_password = hash_password(request.password)
+    hashed_password = await run_in_password_pool(hash_password, request.password)
     new_user = User(email=request.email, hashed_password=hashed_password)
     db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    await db.commit()
+    await db.refresh(new_user)
     return JSONResponse(status_code=201, content={"message": "User created successfully"})
 
 @app.post("/login")
-async def login(request: LoginRequest, db: Session = Depends(get_db)):
+async def login(request: LoginRequest, db: AsyncSession = Depends(get_db)):
     # Find the user in the database
-    db_user = db.query(User).filter(User.email == request.email).first()
+    result = await db.execute(select(User).where(User.email == request.email))
+    db_user = result.scalars().first()
     if not db_user:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Incorrect email or password")
     
     # Verify password
-    if not verify_password(request.password, db_user.hashed_password):
+    if not await run_in_password_pool(verify_password, request.password, db_user.hashed_password):
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Incorrect email or password")
 
-    # Set session (e.g., store user ID in cookie for simplicity)
+    # Set session (signed token carrying the user ID and expiry; admin status comes from the user record)
     response = JSONResponse(content={"message": "Login successful"})
-    response.set_cookie(key="user_id", value=str(db_user.id), httponly=True, secure=True, samesite="None")
+    response.set_cookie(
+        key="session", value=create_session_token(db_user), max_age=SESSION_TTL,
+        httponly=True, secure=True, samesite="None"
+    )
     return response
 
 @app.post("/bookmarks", response_model=Bookmark, status_code=status.HTTP_201_CREATED)
 async def create_bookmark(
     bookmark: BookmarkCreate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
 ):
     """Create a new bookmark for the current user."""
     new_bookmark = models.Bookmark(
@@ -879,42 +1434,179 @@ async def create_bookmark(
     )
     
     db.add(new_bookmark)
-    db.commit()
-    db.refresh(new_bookmark)
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Bookmark already exists")
+    await db.refresh(new_bookmark)
     
     return new_bookmark
 
-@app.get("/bookmarks", response_model=List[Bookmark])
+@app.get("/bookmarks", response_model=BookmarkPage)
 async def get_bookmarks(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
-    skip: int = 0,
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    cursor: Optional[str] = None,
     limit: int = 100
 ):
-    """Get all bookmarks for the current user."""
-    bookmarks = db.query(models.Bookmark).filter(
-        models.Bookmark.user_id == current_user.id
-    ).offset(skip).limit(limit).all()
-    
-    return bookmarks
+    """Get a page of bookmarks for the current user."""
+    return await fetch_page(
+        db,
+        select(models.Bookmark).where(models.Bookmark.user_id == current_user.id),
+        models.Bookmark.id,
+        cursor,
+        limit
+    )
+
+@app.get("/bookmarks/search", response_model=List[BookmarkSearchResult])
+async def search_bookmarks(
+    q: str = Query(..., min_length=1),
+    limit: int = 20,
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Full-text search over the current user's bookmarks, best match first."""
+    rows = await full_text_search(
+        db, models.Bookmark, select(models.Bookmark).where(models.Bookmark.user_id == current_user.id), q, limit
+    )
+    return [with_rank(bookmark, rank) for bookmark, rank in rows]
+
+# Bulk bookmark import/export
+BULK_BATCH_SIZE = int(os.getenv("BULK_BATCH_SIZE", 500))  # Rows per multi-row INSERT
+BULK_MAX_REPORTED_ERRORS = 100
+
+
+async def iter_ndjson(request: Request):
+    """Yield one parsed JSON value per line of a streamed NDJSON request body."""
+    buffer = b""
+    async for chunk in request.stream():
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            if line.strip():
+                yield line
+    if buffer.strip():
+        yield buffer
+
+
+async def iter_bulk_items(request: Request):
+    """Yield raw bookmark items from either an NDJSON stream or a JSON array body."""
+    if "ndjson" in request.headers.get("content-type", ""):
+        async for line in iter_ndjson(request):
+            yield line
+        return
+
+    try:
+        items = await request.json()
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Body must be a JSON array or NDJSON")
+    if not isinstance(items, list):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Body must be a JSON array or NDJSON")
+    for item in items:
+        yield item
+
+
+async def upsert_bookmarks(db: AsyncSession, user_id: int, batch: List[BookmarkCreate]) -> int:
+    """Insert a batch in one multi-row statement, updating bookmarks whose (user_id, url) already exists."""
+    rows = [
+        {
+            "url": bookmark.url,
+            "title": bookmark.title,
+            "description": bookmark.description,
+            "resource_type": bookmark.resource_type,
+            "user_id": user_id,
+        }
+        for bookmark in batch
+    ]
+    written = await upsert_rows(
+        db, models.Bookmark, rows, ["user_id", "url"], ["title", "description", "resource_type"]
+    )
+    await db.commit()
+    return written
+
+
+@app.post("/bookmarks/bulk")
+async def bulk_import_bookmarks(
+    request: Request,
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Import bookmarks from a JSON array, or an NDJSON stream (Content-Type: application/x-ndjson).
+    Each batch is committed on its own; re-running an import is safe since rows are upserted.
+    """
+    received, upserted, invalid = 0, 0, 0
+    errors, batch = [], []
+
+    async for raw_item in iter_bulk_items(request):
+        received += 1
+        try:
+            item = json.loads(raw_item) if isinstance(raw_item, bytes) else raw_item
+            batch.append(BookmarkCreate(**item))
+        except (ValueError, TypeError, ValidationError) as e:
+            invalid += 1
+            if len(errors) < BULK_MAX_REPORTED_ERRORS:
+                errors.append({"index": received - 1, "error": str(e)})
+            continue
+
+        if len(batch) >= BULK_BATCH_SIZE:
+            upserted += await upsert_bookmarks(db, current_user.id, batch)
+            batch = []
+
+    if batch:
+        upserted += await upsert_bookmarks(db, current_user.id, batch)
+
+    return {"received": received, "upserted": upserted, "invalid": invalid, "errors": errors}
+
+
+@app.get("/bookmarks/export")
+async def export_bookmarks(current_user: CurrentUser = Depends(get_current_user)):
+    """Stream all of the current user's bookmarks as NDJSON without loading them into memory."""
+    async def stream_bookmarks():
+        # The request's session is closed before a streaming body runs, so use a dedicated one
+        async with SessionLocal() as db:
+            result = await db.stream_scalars(
+                select(models.Bookmark)
+                .where(models.Bookmark.user_id == current_user.id)
+                .order_by(models.Bookmark.id)
+                .execution_options(yield_per=BULK_BATCH_SIZE)
+            )
+            async for bookmark in result:
+                yield json.dumps({
+                    "url": bookmark.url,
+                    "title": bookmark.title,
+                    "description": bookmark.description,
+                    "resource_type": bookmark.resource_type,
+                }) + "\n"
+
+    return StreamingResponse(
+        stream_bookmarks(),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": 'attachment; filename="bookmarks.ndjson"'}
+    )
+
 
 @app.delete("/bookmarks/{bookmark_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_bookmark(
     bookmark_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
 ):
     """Delete a bookmark if it belongs to the current user."""
-    bookmark = db.query(models.Bookmark).filter(
-        models.Bookmark.id == bookmark_id,
-        models.Bookmark.user_id == current_user.id
-    ).first()
+    result = await db.execute(
+        select(models.Bookmark).where(
+            models.Bookmark.id == bookmark_id,
+            models.Bookmark.user_id == current_user.id
+        )
+    )
+    bookmark = result.scalars().first()
 
     if not bookmark:
         raise HTTPException(status_code=404, detail="Bookmark not found")
 
-    db.delete(bookmark)
-    db.commit()
+    await db.delete(bookmark)
+    await db.commit()
 
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
@@ -922,8 +1614,8 @@ async def delete_bookmark(
 @app.post("/uploads", response_model=CommunityUploadResponse, status_code=status.HTTP_201_CREATED)
 async def submit_resource(
     resource: CommunityUploadCreate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
 ):
     """Allow a user to upload a resource for approval."""
     new_resource = models.CommunityUpload(
@@ -936,18 +1628,89 @@ async def submit_resource(
     )
 
     db.add(new_resource)
-    db.commit()
-    db.refresh(new_resource)
+    await db.commit()
+    await db.refresh(new_resource)
 
     return new_resource
    
 
+MAX_BULK_STATUS_IDS = int(os.getenv("MAX_BULK_STATUS_IDS", 1000))
+
+@app.put("/uploads/status")
+async def bulk_update_resource_status(
+    status_update: BulkStatusUpdate,
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Allow an admin to approve or reject many resources with a single UPDATE."""
+    if not current_user.is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You don't have the necessary permissions to approve or reject resources"
+        )
+
+    if status_update.status not in ["approved", "rejected"]:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid status. Must be either 'approved' or 'rejected'."
+        )
+
+    ids = list(dict.fromkeys(status_update.ids))  # Drop duplicates, keep request order
+    if len(ids) > MAX_BULK_STATUS_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {MAX_BULK_STATUS_IDS} ids can be updated per request."
+        )
+
+    # One set-based UPDATE ... RETURNING for every row not already in the target state
+    result = await db.execute(
+        update(models.CommunityUpload)
+        .where(
+            models.CommunityUpload.id.in_(ids),
+            models.CommunityUpload.status.is_distinct_from(status_update.status)
+        )
+        .values(status=status_update.status)
+        .returning(models.CommunityUpload.id)
+        .execution_options(synchronize_session=False)
+    )
+    updated_ids = set(result.scalars().all())
+
+    # Ids the UPDATE skipped either don't exist or were already in the target state
+    unchanged_ids = [resource_id for resource_id in ids if resource_id not in updated_ids]
+    existing_ids = set()
+    if unchanged_ids:
+        result = await db.execute(
+            select(models.CommunityUpload.id).where(models.CommunityUpload.id.in_(unchanged_ids))
+        )
+        existing_ids = set(result.scalars().all())
+
+    await db.commit()
+
+    results = []
+    for resource_id in ids:
+        if resource_id in updated_ids:
+            outcome = "updated"
+        elif resource_id in existing_ids:
+            outcome = "already_in_state"
+        else:
+            outcome = "not_found"
+        results.append({"id": resource_id, "outcome": outcome})
+
+    return {
+        "status": status_update.status,
+        "updated": len(updated_ids),
+        "already_in_state": len(existing_ids),
+        "not_found": len(ids) - len(updated_ids) - len(existing_ids),
+        "results": results,
+    }
+
+
 @app.put("/uploads/{resource_id}/status", response_model=CommunityUploadResponse)
 async def update_resource_status(
     resource_id: int,
     status_update: str,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
 ):
     """Allow an admin to approve or reject a resource."""
     
@@ -959,7 +1722,8 @@ async def update_resource_status(
         )
     
     # Fetch the resource
-    resource = db.query(models.CommunityUpload).filter(models.CommunityUpload.id == resource_id).first()
+    result = await db.execute(select(models.CommunityUpload).where(models.CommunityUpload.id == resource_id))
+    resource = result.scalars().first()
 
     if not resource:
         raise HTTPException(
@@ -976,40 +1740,70 @@ async def update_resource_status(
 
     # Update the status
     resource.status = status_update
-    db.commit()
-    db.refresh(resource)
+    await db.commit()
+    await db.refresh(resource)
 
     return resource
 
-@app.get("/uploads/pending_approval", response_model=List[CommunityUploadResponse])
+@app.get("/uploads/pending_approval", response_model=CommunityUploadPage)
 async def get_pending_approval_resources(
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    cursor: Optional[str] = None,
+    limit: int = 50
 ):
-    """Retrieve all resources with 'pending_approval' status."""
+    """Retrieve a page of resources with 'pending_approval' status."""
     
     # Query for resources that are pending approval
-    pending_resources = db.query(models.CommunityUpload).filter(models.CommunityUpload.status == "pending_approval").all()
-
-    return pending_resources
+    return await fetch_page(
+        db,
+        select(models.CommunityUpload).where(models.CommunityUpload.status == "pending_approval"),
+        models.CommunityUpload.id,
+        cursor,
+        limit
+    )
 
-@app.get("/uploads/approved", response_model=List[CommunityUploadResponse])
-async def get_pending_approval_resources(
-    db: Session = Depends(get_db)
-):    
-    approved_resources = db.query(models.CommunityUpload).filter(models.CommunityUpload.status == "approved").all()
+@app.get("/uploads/approved", response_model=CommunityUploadPage)
+async def get_approved_resources(
+    db: AsyncSession = Depends(get_db),
+    cursor: Optional[str] = None,
+    limit: int = 50
+):
+    """Retrieve a page of approved resources."""
+    return await fetch_page(
+        db,
+        select(models.CommunityUpload).where(models.CommunityUpload.status == "approved"),
+        models.CommunityUpload.id,
+        cursor,
+        limit
+    )
 
-    return approved_resources
+@app.get("/uploads/search", response_model=List[CommunityUploadSearchResult])
+async def search_approved_resources(
+    q: str = Query(..., min_length=1),
+    limit: int = 20,
+    db: AsyncSession = Depends(get_db)
+):
+    """Full-text search over approved resources, best match first."""
+    rows = await full_text_search(
+        db,
+        models.CommunityUpload,
+        select(models.CommunityUpload).where(models.CommunityUpload.status == "approved"),
+        q,
+        limit
+    )
+    return [with_rank(upload, rank) for upload, rank in rows]
 
 @app.get("/courses")
 async def get_coursera_courses(
     query: str = Query(..., min_length=1),
     max_results: int = Query(10, ge=1, le=50),
-    page: int = Query(1, ge=1)
+    page: int = Query(1, ge=1),
+    mode: str = Query("and", pattern="^(and|or)$", title="Match all terms (and) or any term (or)")
 ):
     """API to fetch Coursera courses based on search query with pagination."""
     try:
         print("query", query)
-        courses = await fetch_coursera_courses(query, max_results, page)
+        courses = await fetch_coursera_courses(query, max_results, page, mode)
         return {"query": query, "page": page, "results": courses}
     except HTTPException as e:
         # Re-raise HTTP exceptions (they already have proper status codes)
@@ -1022,9 +1816,41 @@ async def get_coursera_courses(
         return {"query": query, "page": page, "results": []}
 
 @app.get("/ai-handbooks")
-async def get_ai_handbooks():
+async def get_ai_handbooks(
+    q: Optional[str] = Query(None, title="Search Query"),
+    mode: str = Query("and", pattern="^(and|or)$", title="Match all terms (and) or any term (or)")
+):
+    if q:
+        return {"handbooks": handbook_index.search(q, mode=mode)}
     return {"handbooks": AI_HANDBOOKS}
 
+@app.get("/debug/password-hashing")
+async def get_password_pool_stats(current_user: CurrentUser = Depends(get_admin_user)):
+    """Worker count, bcrypt cost and queue depth of the password hashing pool."""
+    with password_pool_lock:
+        return {
+            **password_pool_stats,
+            "queue_depth": password_queue_depth(),
+            "workers": PASSWORD_HASH_WORKERS,
+            "bcrypt_rounds": BCRYPT_ROUNDS,
+        }
+
+@app.get("/debug/db-pool")
+async def get_db_pool_stats(current_user: CurrentUser = Depends(get_admin_user)):
+    """Checked-out connections, overflow, checkout wait histogram and timeout count of the DB pool."""
+    return get_pool_stats()
+
+@app.get("/debug/github-quota")
+async def get_github_quota(current_user: CurrentUser = Depends(get_admin_user)):
+    """Last seen GitHub rate limit per quota bucket, plus pacing and ETag revalidation counters."""
+    return github.snapshot()
+
+
+@app.get("/debug/cache")
+async def get_cache_stats(current_user: CurrentUser = Depends(get_admin_user)):
+    """Hit/miss counters and size of the upstream search result cache, plus prewarming activity."""
+    return {**await search_cache.snapshot(), "prewarm": prewarmer.snapshot()}
+
 
 if __name__ == "__main__":
     import uvicorn
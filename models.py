@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, Text, TIMESTAMP, UniqueConstraint, Boolean
+from sqlalchemy import Column, Integer, String, ForeignKey, Text, TIMESTAMP, UniqueConstraint, Boolean, Index, text, JSON
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from database import Base
@@ -15,6 +15,10 @@ class User(Base):
     bookmarks = relationship("Bookmark", back_populates="user")
     uploads = relationship("CommunityUpload", back_populates="user")
 
+# community_uploads, bookmarks and resources also carry a `search_vector` tsvector column, generated by
+# Postgres from title + description and GIN-indexed (see the full-text search migration).
+# It is left out of the models so they stay portable to SQLite.
+
 class Bookmark(Base):
     __tablename__ = "bookmarks"
 
@@ -27,6 +31,11 @@ class Bookmark(Base):
 
     user = relationship("User", back_populates="bookmarks")  # Change 'owner' to 'user'
 
+    __table_args__ = (
+        Index("ix_bookmarks_user_id_id", "user_id", "id"),  # WHERE user_id = ? ORDER BY id
+        UniqueConstraint("user_id", "url", name="uq_bookmarks_user_id_url"),  # Upsert target for bulk imports
+    )
+
 class CommunityUpload(Base):
     __tablename__ = "community_uploads"
 
@@ -40,4 +49,28 @@ class CommunityUpload(Base):
 
     user = relationship("User", back_populates="uploads")  # Fix the relationship here
 
+    __table_args__ = (
+        Index("ix_community_uploads_status_id", "status", "id"),  # WHERE status = ? ORDER BY id
+        # Small partial index for the moderation queue
+        Index(
+            "ix_community_uploads_pending_id", "id",
+            postgresql_where=text("status = 'pending_approval'"),
+            sqlite_where=text("status = 'pending_approval'"),
+        ),
+    )
+
+class Resource(Base):
+    """A GitHub repo, arXiv paper or Reddit post harvested ahead of time (see harvest.py)."""
+    __tablename__ = "resources"
+
+    id = Column(Integer, primary_key=True, index=True)
+    url = Column(String, nullable=False, unique=True)  # Upsert target for re-harvests
+    resource_type = Column(String, nullable=False)  # Same values as the fetchers: 'github', 'arxiv paper', 'blog'
+    title = Column(String, nullable=False)
+    description = Column(Text)
+    data = Column(JSON, nullable=False)  # The fetcher's dict, returned as-is by local searches
+    harvested_at = Column(TIMESTAMP, server_default=func.now(), nullable=False)
 
+    __table_args__ = (
+        Index("ix_resources_resource_type_id", "resource_type", "id"),
+    )
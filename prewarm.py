@@ -0,0 +1,135 @@
+import asyncio
+import time
+from collections import Counter, deque
+from typing import List, Optional
+
+from cache import SearchCache
+
+
+class Prewarmer:
+    """
+    Background refresher for the most popular search queries.
+
+    Counts lookups per normalized query through the cache's listener hook and,
+    every `interval` seconds, reloads the cached results of the top-N queries
+    that expire within `lead_time`, so their next request is a cache hit.
+    Upstream requests are capped at `calls_per_minute`, charging each refresh
+    `call_cost(source, key)` requests (one cache entry can take several, e.g. a
+    GitHub search plus its /contributors calls). The budget is per process, so
+    N workers spend up to N times it. Counts are halved after each cycle so
+    popularity follows recent traffic.
+    """
+
+    def __init__(self, cache: SearchCache, top_n: int = 20, interval: float = 60, lead_time: float = 120,
+                 calls_per_minute: int = 30, max_tracked: int = 1000, call_cost=lambda source, key: 1):
+        self.cache = cache
+        self.top_n = top_n
+        self.interval = interval
+        self.lead_time = lead_time
+        self.calls_per_minute = calls_per_minute
+        self.max_tracked = max_tracked
+        self.call_cost = call_cost
+
+        self.counts = Counter()  # normalized query -> recent lookups
+        self.entries = {}  # normalized query -> {cache key: (source, fetcher)}
+        self.recent_calls = deque()  # Start time of each upstream request in the last minute
+        self.stats = {"cycles": 0, "refreshes": 0, "failures": 0, "budget_exhausted": 0, "over_budget": 0}
+
+        self._task: Optional[asyncio.Task] = None
+        self._stopping: Optional[asyncio.Event] = None
+
+    def record(self, source: str, query: str, key: str, fetcher):
+        normalized_query = SearchCache.normalize_query(query)
+        if normalized_query not in self.entries and len(self.entries) >= self.max_tracked:
+            return  # Full until the next decay frees room; keeps a burst of one-off queries from piling up
+        self.counts[normalized_query] += 1
+        self.entries.setdefault(normalized_query, {})[key] = (source, fetcher)
+
+    def popular_queries(self) -> List[str]:
+        return [query for query, _ in self.counts.most_common(self.top_n)]
+
+    def _take_budget(self, cost: int) -> bool:
+        """Reserve `cost` upstream requests if the per-minute budget allows them."""
+        now = time.monotonic()
+        while self.recent_calls and now - self.recent_calls[0] >= 60:
+            self.recent_calls.popleft()
+        if len(self.recent_calls) + cost > self.calls_per_minute:
+            return False
+        self.recent_calls.extend([now] * cost)
+        return True
+
+    async def run_once(self) -> int:
+        """Refresh entries of the popular queries that are about to expire; returns the number refreshed."""
+        refreshed = 0
+        for query in self.popular_queries():
+            for key, (source, fetcher) in list(self.entries.get(query, {}).items()):
+                if self._stopping.is_set():
+                    return refreshed
+                expires_in = await self.cache.expires_in(source, key)
+                if expires_in is not None and expires_in > self.lead_time:
+                    continue
+                cost = self.call_cost(source, key)
+                if cost > self.calls_per_minute:
+                    self.stats["over_budget"] += 1
+                    continue  # Could never fit; don't let it block cheaper entries
+                if not self._take_budget(cost):
+                    self.stats["budget_exhausted"] += 1
+                    return refreshed
+                try:
+                    await self.cache.refresh(key, fetcher)
+                    refreshed += 1
+                    self.stats["refreshes"] += 1
+                except Exception as e:
+                    self.stats["failures"] += 1
+                    print(f"Prewarm failed for cache key '{key}': {e}")
+        return refreshed
+
+    def _decay(self):
+        """Halve the counts and forget queries that fell to zero or out of the tracked set."""
+        kept = Counter({query: count // 2 for query, count in self.counts.most_common(self.max_tracked) if count // 2})
+        self.entries = {query: entries for query, entries in self.entries.items() if query in kept}
+        self.counts = kept
+
+    async def run(self):
+        while not self._stopping.is_set():
+            try:
+                refreshed = await self.run_once()
+                if refreshed:
+                    print(f"Prewarmed {refreshed} cache entries for popular queries")
+            except Exception as e:
+                print(f"Prewarm cycle failed: {e}")
+            self.stats["cycles"] += 1
+            self._decay()
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=self.interval)
+            except asyncio.TimeoutError:
+                pass
+
+    def start(self):
+        if self.top_n <= 0 or self._task is not None:
+            return
+        self._stopping = asyncio.Event()  # Created here so it belongs to the running event loop
+        # Only track lookups while running: nothing else decays the counts
+        self.cache.listeners.append(self.record)
+        self._task = asyncio.create_task(self.run())
+
+    async def stop(self, grace: float = 5):
+        """Let the current refresh finish (up to `grace` seconds), then cancel the loop."""
+        if self._task is None:
+            return
+        self._stopping.set()
+        try:
+            await asyncio.wait_for(self._task, timeout=grace)
+        except (asyncio.TimeoutError, asyncio.CancelledError):
+            pass
+        self.cache.listeners.remove(self.record)
+        self._task = None
+
+    def snapshot(self) -> dict:
+        return {
+            **self.stats,
+            "running": self._task is not None,
+            "tracked_queries": len(self.counts),
+            "popular_queries": self.counts.most_common(self.top_n),
+            "calls_last_minute": len(self.recent_calls),
+        }
@@ -0,0 +1,202 @@
+import argparse
+import asyncio
+import os
+import time
+from typing import List, Optional
+
+import joblib
+import numpy as np
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.metrics.pairwise import cosine_similarity
+
+from catalogs import AI_COURSES, AI_HANDBOOKS
+
+# Where the offline-fitted TF-IDF model is stored (build it with `python ranking.py`)
+RANKING_MODEL_PATH = os.getenv("RANKING_MODEL_PATH", "ranking_model.joblib")
+
+# Seed queries used to harvest a corpus from the upstream sources when fitting offline
+DEFAULT_SEED_QUERIES = [
+    "machine learning", "deep learning", "llm", "transformers", "computer vision",
+    "natural language processing", "reinforcement learning", "diffusion models",
+    "neural networks", "data science", "generative ai", "mlops",
+]
+
+ranking_model: Optional[TfidfVectorizer] = None  # Loaded at startup, shared by all requests
+
+
+def resource_text(resource: dict) -> str:
+    """Text a resource is ranked on: its title/name plus summary/description."""
+    return (
+        (resource.get("title") or resource.get("name") or "") + " " +
+        (resource.get("summary") or resource.get("description") or "")
+    )
+
+
+def fit_ranking_model(texts: List[str]) -> TfidfVectorizer:
+    """Fit vocabulary and IDF statistics on a corpus of resource texts."""
+    vectorizer = TfidfVectorizer(stop_words="english")
+    vectorizer.fit(texts)
+    return vectorizer
+
+
+def save_ranking_model(vectorizer: TfidfVectorizer, path: str = RANKING_MODEL_PATH):
+    joblib.dump(vectorizer, path)
+
+
+def load_ranking_model(path: str = RANKING_MODEL_PATH) -> Optional[TfidfVectorizer]:
+    """Load the persisted model into `ranking_model`; returns None if it hasn't been built yet."""
+    global ranking_model
+    if not os.path.exists(path):
+        print(f"⚠️  No ranking model at {path}, fitting TF-IDF per request. Run `python ranking.py` to build one.")
+        return None
+    ranking_model = joblib.load(path)
+    print(f"Loaded ranking model from {path} ({len(ranking_model.vocabulary_)} terms)")
+    return ranking_model
+
+
+def rank_results(query: str, resources: List[dict] = None, top_k: Optional[int] = None, offset: int = 0) -> List[dict]:
+    """
+    Score resources against the query and return the ranked page [offset, offset + top_k)
+    (all of them when top_k is None), each copied with a float `similarity_score`.
+    """
+    if resources is None or len(resources) == 0:
+        return []
+    query = query.lower().strip()
+
+    # Extract titles and descriptions
+    resource_texts = [resource_text(resource) for resource in resources]
+
+    if ranking_model is not None:
+        # Pre-fitted vocabulary and IDF: only transform at request time
+        query_vector = ranking_model.transform([query])
+        resource_vectors = ranking_model.transform(resource_texts)
+    else:
+        # No persisted model yet: fit on the query plus the candidates
+        tfidf_matrix = TfidfVectorizer(stop_words="english").fit_transform([query] + resource_texts)
+        query_vector = tfidf_matrix[0]  # The first vector is the query
+        resource_vectors = tfidf_matrix[1:]  # Remaining vectors are resource texts
+
+    # TF-IDF rows are L2-normalised, so one sparse product gives every cosine similarity
+    scores = (resource_vectors @ query_vector.T).toarray().ravel()
+
+    # Select the top `end` candidates in linear time instead of sorting them all
+    end = len(resources) if top_k is None else min(len(resources), offset + top_k)
+    if end < len(resources):
+        # The end-th best score; of the candidates tied on it (often the many 0.0s), keep the earliest
+        cutoff = -np.partition(-scores, end - 1)[end - 1]
+        above = np.flatnonzero(scores > cutoff)
+        tied = np.flatnonzero(scores == cutoff)[:end - len(above)]
+        candidates = np.concatenate((above, tied))
+    else:
+        candidates = np.arange(len(resources))
+    # Highest score first; ties keep their original order
+    ordered = candidates[np.lexsort((candidates, -scores[candidates]))]
+
+    return [
+        {**resources[i], "similarity_score": float(scores[i])}
+        for i in ordered[offset:end]
+    ]
+
+
+def legacy_rank_results(query: str, resources: List[dict] = None) -> List[dict]:
+    """The previous per-request ranking (fit, cosine_similarity, full sort), kept as the benchmark baseline."""
+    if resources is None or len(resources) == 0:
+        return []
+    query = query.lower().strip()
+
+    resource_texts = [resource_text(resource) for resource in resources]
+    tfidf_matrix = TfidfVectorizer(stop_words="english").fit_transform([query] + resource_texts)
+    similarities = cosine_similarity(tfidf_matrix[0], tfidf_matrix[1:]).flatten()
+
+    for i, resource in enumerate(resources):
+        resource["similarity_score"] = similarities[i]
+    return sorted(resources, key=lambda x: x["similarity_score"], reverse=True)
+
+
+def catalog_texts() -> List[str]:
+    return [resource_text(resource) for resource in AI_COURSES + AI_HANDBOOKS]
+
+
+async def build_corpus(seed_queries: List[str]) -> List[str]:
+    """Collect resource texts from the curated catalogs, approved uploads, the `resources` table and live search results."""
+    # Imported here: the app module (and its credentials) is only needed when fitting offline
+    import main
+    import models
+    from database import SessionLocal
+    from sqlalchemy import select
+
+    texts = catalog_texts()
+
+    async with SessionLocal() as db:
+        result = await db.execute(select(models.CommunityUpload).where(models.CommunityUpload.status == "approved"))
+        texts += [f"{upload.title} {upload.description}" for upload in result.scalars().all()]
+
+        # Everything the harvest pipeline has stored (see harvest.py)
+        result = await db.stream_scalars(select(models.Resource.data).execution_options(yield_per=1000))
+        texts += [resource_text(resource) async for resource in result]
+
+    try:
+        for query in seed_queries:
+            harvested = await asyncio.gather(
+                main.fetch_github_repos(query, per_page=100, include_contributors=False),
+                main.fetch_arxiv_papers(query, max_results=100),
+                main.fetch_blogs(query, max_results=25),
+                return_exceptions=True,
+            )
+            for results in harvested:
+                if isinstance(results, Exception):
+                    print(f"Skipping a source for '{query}': {results}")
+                    continue
+                texts += [resource_text(resource) for resource in results]
+            print(f"Harvested corpus for '{query}': {len(texts)} documents so far")
+    finally:
+        await main.close_reddit_client()
+        await main.close_http_clients()
+
+    return texts
+
+
+def benchmark(texts: List[str], vectorizer: TfidfVectorizer, sizes=(50, 5000, 50000), top_k: int = 20):
+    """Compare per-request ranking latency of the old code (legacy_rank_results) against pre-fitted top-k."""
+    global ranking_model
+    previous_model, ranking_model = ranking_model, vectorizer
+    try:
+        for size in sizes:
+            sample = [{"title": text} for text in (texts * (size // max(len(texts), 1) + 1))[:size]]
+            rounds = max(1, 2000 // size)
+
+            timings = {}
+            for label, rank in (
+                ("fit + cosine_similarity + sort", lambda: legacy_rank_results("transformer language models", sample)),
+                ("pre-fitted top-k", lambda: rank_results("transformer language models", sample, top_k=top_k)),
+            ):
+                started = time.perf_counter()
+                for _ in range(rounds):
+                    rank()
+                timings[label] = (time.perf_counter() - started) / rounds * 1000
+            print(f"{size:>6} candidates: " + ", ".join(f"{label} {elapsed_ms:.2f} ms" for label, elapsed_ms in timings.items()))
+    finally:
+        ranking_model = previous_model
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fit the TF-IDF ranking model offline and persist it.")
+    parser.add_argument("--queries", default=",".join(DEFAULT_SEED_QUERIES), help="Comma-separated seed queries")
+    parser.add_argument("--output", default=RANKING_MODEL_PATH, help="Where to write the fitted model")
+    parser.add_argument("--benchmark", action="store_true",
+                        help="Compare per-request ranking latency for 50, 5k and 50k candidates, using the model "
+                             "at --output if it exists (no harvest) and fitting one first otherwise")
+    parser.add_argument("--refit", action="store_true", help="With --benchmark, fit a new model even if one exists")
+    args = parser.parse_args()
+
+    if args.benchmark and not args.refit and os.path.exists(args.output):
+        # Benchmark-only: the catalogs are enough sample text, so no credentials, database or harvest are needed
+        benchmark(catalog_texts(), joblib.load(args.output))
+    else:
+        corpus = asyncio.run(build_corpus([query.strip() for query in args.queries.split(",") if query.strip()]))
+        model = fit_ranking_model(corpus)
+        save_ranking_model(model, args.output)
+        print(f"Saved ranking model to {args.output}: {len(corpus)} documents, {len(model.vocabulary_)} terms")
+
+        if args.benchmark:
+            benchmark(corpus, model)
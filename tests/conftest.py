@@ -0,0 +1,13 @@
+import os
+import sys
+import tempfile
+
+# Run against a throwaway SQLite database and dummy credentials; never the real services
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{tempfile.mkdtemp()}/test.db")
+os.environ.setdefault("OPENAI_API_KEY", "test")
+os.environ.setdefault("REDDIT_CLIENT_ID", "test")
+os.environ.setdefault("REDDIT_CLIENT_SECRET", "test")
+os.environ.setdefault("SESSION_SECRET", "test")
+os.environ.setdefault("BCRYPT_ROUNDS", "4")  # Keep hashing fast
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,131 @@
+import asyncio
+import time
+import tracemalloc
+import xml.etree.ElementTree as ET
+
+import httpx
+import pytest
+
+import main
+
+ATOM = "{http://www.w3.org/2005/Atom}"
+
+
+def parse_with_element_tree(text: str) -> list:
+    """The previous whole-document parser, kept as the reference for the streaming one."""
+    root = ET.fromstring(text)
+    papers = []
+    for entry in root.findall(f"{ATOM}entry"):
+        papers.append({
+            "resource_type": "arxiv paper",
+            "title": entry.find(f"{ATOM}title").text,
+            "summary": entry.find(f"{ATOM}summary").text,
+            "link": entry.find(f"{ATOM}id").text,
+            "authors": [author.find(f"{ATOM}name").text for author in entry.findall(f"{ATOM}author")],
+            "published_date": entry.find(f"{ATOM}published").text,
+        })
+    return papers
+
+
+@pytest.fixture(scope="module")
+def feed_500() -> bytes:
+    """A 500-entry arXiv feed with multi-line text, entities, non-ASCII names and 0-4 authors per entry."""
+    entries = []
+    for i in range(500):
+        authors = "".join(
+            f"<author><name>Author {i}-{a} Müller</name><arxiv:affiliation>Lab {a}</arxiv:affiliation></author>"
+            for a in range(i % 5)
+        )
+        entries.append(f"""
+  <entry>
+    <id>http://arxiv.org/abs/2401.{i:05d}v1</id>
+    <updated>2024-01-{i % 28 + 1:02d}T10:00:00Z</updated>
+    <published>2024-01-{i % 28 + 1:02d}T09:00:00Z</published>
+    <title>Paper {i}: Scaling &amp; Attention
+  in Transformers</title>
+    <summary>  Summary of paper {i} with &lt;markup&gt; and unicode α→β.
+Second line of the abstract.
+</summary>
+    {authors}
+    <link href="http://arxiv.org/abs/2401.{i:05d}v1" rel="alternate" type="text/html"/>
+    <arxiv:primary_category term="cs.LG" scheme="http://arxiv.org/schemas/atom"/>
+    <category term="cs.LG" scheme="http://arxiv.org/schemas/atom"/>
+  </entry>""")
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<feed xmlns="http://www.w3.org/2005/Atom" xmlns:arxiv="http://arxiv.org/schemas/atom" '
+        'xmlns:opensearch="http://a9.com/-/spec/opensearch/1.1/">\n'
+        "  <id>http://arxiv.org/api/query</id>\n"
+        "  <opensearch:totalResults>500</opensearch:totalResults>"
+        + "".join(entries)
+        + "\n</feed>\n"
+    ).encode("utf-8")
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 4096, 1 << 20])
+def test_streaming_parser_matches_tree_parser(feed_500, chunk_size):
+    async def chunks():
+        for start in range(0, len(feed_500), chunk_size):
+            yield feed_500[start:start + chunk_size]
+
+    async def parse():
+        response = httpx.Response(200, content=chunks())
+        return [paper async for paper in main.stream_arxiv_entries(response)]
+
+    streamed = asyncio.run(parse())
+
+    assert len(streamed) == 500
+    assert streamed == parse_with_element_tree(feed_500.decode("utf-8"))
+
+
+def test_fetch_arxiv_papers_streams_the_recorded_feed(feed_500, monkeypatch):
+    async def fetch():
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, content=feed_500))
+        monkeypatch.setitem(main.http_clients, "arxiv", httpx.AsyncClient(transport=transport))
+        return await main.fetch_arxiv_papers("transformers", max_results=500)
+
+    papers = asyncio.run(fetch())
+
+    assert papers == parse_with_element_tree(feed_500.decode("utf-8"))
+    assert papers[3]["authors"] == ["Author 3-0 Müller", "Author 3-1 Müller", "Author 3-2 Müller"]
+    assert papers[0]["authors"] == []
+
+
+def test_streaming_parser_lowers_peak_memory_and_time_to_first_paper(feed_500):
+    """
+    Parser-level only: fetch_arxiv_papers still collects the whole feed before returning,
+    so routes see their first arXiv result no sooner than before.
+    """
+    async def chunks():
+        for start in range(0, len(feed_500), 4096):
+            yield feed_500[start:start + 4096]
+
+    async def stream_until_first():
+        started = time.perf_counter()
+        async for _ in main.stream_arxiv_entries(httpx.Response(200, content=chunks())):
+            return time.perf_counter() - started
+
+    async def stream_all():
+        return [paper async for paper in main.stream_arxiv_entries(httpx.Response(200, content=chunks()))]
+
+    text = feed_500.decode("utf-8")  # The old path had the decoded body in memory before parsing, too
+
+    tracemalloc.start()
+    try:
+        parse_with_element_tree(text)
+        tree_peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.reset_peak()
+        asyncio.run(stream_all())
+        stream_peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    started = time.perf_counter()
+    parse_with_element_tree(text)  # The tree parser yields nothing until the whole feed is parsed
+    tree_first = time.perf_counter() - started
+    stream_first = asyncio.run(stream_until_first())
+
+    print(f"\n500-entry feed ({len(feed_500) / 1024:.0f} KiB): peak {tree_peak / 1024:.0f} KiB -> {stream_peak / 1024:.0f} KiB, "
+          f"first paper after {tree_first * 1000:.1f} ms -> {stream_first * 1000:.1f} ms")
+    assert stream_peak < tree_peak / 2
+    assert stream_first < tree_first / 2
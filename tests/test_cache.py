@@ -0,0 +1,76 @@
+import asyncio
+import sqlite3
+import time
+
+from cache import MemoryCache, SearchCache
+
+
+def test_concurrent_identical_requests_make_one_upstream_call():
+    calls = []
+
+    async def fetcher():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return [{"title": "result"}]
+
+    async def run():
+        cache = SearchCache(MemoryCache(), {"github": 60})
+        results = await asyncio.gather(*(
+            cache.fetch("github", "LLM  agents", 1, 10, fetcher) for _ in range(50)
+        ))
+        return cache, results
+
+    cache, results = asyncio.run(run())
+
+    assert len(calls) == 1
+    assert all(result == [{"title": "result"}] for result in results)
+    assert cache.stats["misses"] == 50
+    assert cache.flight.stats == {"upstream_calls": 1, "coalesced": 49}
+
+
+def test_stale_hit_serves_cached_value_and_refreshes_once_in_background():
+    calls = []
+
+    async def fetcher():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return ["fresh"]
+
+    async def run():
+        cache = SearchCache(MemoryCache(), {"github": 60}, stale_ttl=600)
+        key = cache.make_key("github", "llm", 1, 10)
+        cache.backend.set(key, ["stale"], time.time() - 120)  # Past its TTL, inside the stale window
+
+        results = await asyncio.gather(*(cache.fetch("github", "llm", 1, 10, fetcher) for _ in range(20)))
+        await asyncio.sleep(0.05)  # Let the background refresh finish
+        return cache, key, results
+
+    cache, key, results = asyncio.run(run())
+
+    assert results == [["stale"]] * 20
+    assert len(calls) == 1
+    assert cache.stats["stale_hits"] == 20
+    assert cache.stats["refreshes"] == 1
+    assert cache.backend.get(key)[0] == ["fresh"]
+
+
+def test_backend_errors_fail_open():
+    class LockedBackend:
+        async def get(self, key):
+            raise sqlite3.OperationalError("database is locked")
+
+        async def set(self, key, value, stored_at):
+            raise sqlite3.OperationalError("database is locked")
+
+    async def fetcher():
+        return ["upstream"]
+
+    async def run():
+        cache = SearchCache(LockedBackend(), {"github": 60})
+        return cache, await cache.fetch("github", "llm", 1, 10, fetcher)
+
+    cache, result = asyncio.run(run())
+
+    assert result == ["upstream"]
+    assert cache.stats["misses"] == 1
+    assert cache.stats["backend_errors"] == 2
@@ -0,0 +1,54 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+import main
+
+
+class HangingCompletions:
+    """Stands in for the OpenAI client: every stream waits until released."""
+
+    def __init__(self):
+        self.release = asyncio.Event()
+        self.chat = self
+        self.completions = self
+
+    async def create(self, **kwargs):
+        await self.release.wait()
+        return self
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        raise StopAsyncIteration
+
+    async def close(self):
+        pass
+
+
+def test_chat_reserves_its_slot_before_streaming(monkeypatch):
+    async def scenario():
+        fake = HangingCompletions()
+        monkeypatch.setattr(main, "openai_client", fake)
+        monkeypatch.setattr(main, "chat_stream_slots", asyncio.Semaphore(2))
+
+        # Both responses hold a slot before their generators run, so the third is turned away
+        first = await main.chatbot(main.ChatRequest(message="hello"))
+        second = await main.chatbot(main.ChatRequest(message="hello"))
+        with pytest.raises(HTTPException) as rejected:
+            await main.chatbot(main.ChatRequest(message="hello"))
+        assert rejected.value.status_code == 503
+
+        # A finished stream gives its slot back once, even though the background task runs too
+        fake.release.set()
+        assert [frame async for frame in first.body_iterator] == ["data: [DONE]\n\n"]
+        await first.background()
+        assert main.chat_stream_slots._value == 1
+
+        # A response whose stream never started frees its slot from the background task
+        await second.background()
+        assert main.chat_stream_slots._value == 2
+
+    asyncio.run(scenario())
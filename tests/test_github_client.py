@@ -0,0 +1,35 @@
+import asyncio
+import time
+
+import httpx
+
+from github_client import GitHubClient
+
+
+def test_etag_revalidations_are_not_paced_or_counted():
+    def handler(request):
+        headers = {
+            "X-RateLimit-Limit": "5000",
+            "X-RateLimit-Remaining": "40",  # Below the pacing threshold
+            "X-RateLimit-Reset": str(int(time.time()) + 60),
+            "X-RateLimit-Resource": "core",
+            "ETag": '"v1"',
+        }
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304, headers=headers)
+        return httpx.Response(200, json={"full_name": "o/x"}, headers=headers)
+
+    async def run():
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        github = GitHubClient(lambda: client, max_wait=30)
+        responses = [await github.get("https://api.github.com/repos/o/x") for _ in range(4)]
+        await client.aclose()
+        return github, responses
+
+    github, responses = asyncio.run(run())
+
+    assert [response.json() for response in responses] == [{"full_name": "o/x"}] * 4
+    assert github.stats["not_modified"] == 3
+    assert github.stats["paced"] == 0
+    assert github.stats["waited_s"] == 0
+    assert github.buckets["core"]["remaining"] == 40
@@ -0,0 +1,135 @@
+import asyncio
+import json
+import os
+
+import httpx
+import pytest
+
+import harvest
+import main
+import models
+from database import Base, SessionLocal, engine
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+def load_fixture(name: str) -> bytes:
+    with open(os.path.join(FIXTURES, name), "rb") as fixture:
+        return fixture.read()
+
+
+def recorded_upstreams(request: httpx.Request) -> httpx.Response:
+    """Replay the recorded GitHub search and arXiv feed for any query."""
+    if request.url.host == "api.github.com":
+        return httpx.Response(200, content=load_fixture("github_search_transformers.json"),
+                              headers={"Content-Type": "application/json"})
+    return httpx.Response(200, content=load_fixture("arxiv_transformers.xml"),
+                          headers={"Content-Type": "application/atom+xml"})
+
+
+@pytest.fixture
+def run_with_db(monkeypatch):
+    """Run a coroutine against fresh tables, with upstreams replaying the recorded fixtures."""
+    async def fetch_recorded_blogs(query, max_results=5):
+        return json.loads(load_fixture("reddit_transformers.json"))
+
+    monkeypatch.setattr(main, "fetch_blogs", fetch_recorded_blogs)
+
+    def run(test):
+        async def wrapper():
+            transport = httpx.MockTransport(recorded_upstreams)
+            monkeypatch.setitem(main.http_clients, "github", httpx.AsyncClient(transport=transport))
+            monkeypatch.setitem(main.http_clients, "arxiv", httpx.AsyncClient(transport=transport))
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+            try:
+                return await test()
+            finally:
+                async with engine.begin() as conn:
+                    await conn.run_sync(Base.metadata.drop_all)
+                await engine.dispose()
+        return asyncio.run(wrapper())
+
+    return run
+
+
+def test_normalize_resource_maps_each_fetcher_shape():
+    repo, paper, post = (
+        {"resource_type": "github", "name": "transformers", "full_name": "huggingface/transformers",
+         "description": "State of the art ML", "url": "https://github.com/huggingface/transformers"},
+        {"resource_type": "arxiv paper", "title": "Attention Is All You\n  Need", "summary": "  The dominant\nmodels ",
+         "link": "http://arxiv.org/abs/1706.03762v7"},
+        {"resource_type": "blog", "title": "A post", "url": "https://reddit.com/r/x/1", "description": "Body"},
+    )
+
+    assert harvest.normalize_resource(repo) == {
+        "url": "https://github.com/huggingface/transformers", "resource_type": "github",
+        "title": "huggingface/transformers", "description": "State of the art ML", "data": repo,
+    }
+    assert harvest.normalize_resource(paper) == {
+        "url": "http://arxiv.org/abs/1706.03762v7", "resource_type": "arxiv paper",
+        "title": "Attention Is All You Need", "description": "The dominant models", "data": paper,
+    }
+    assert harvest.normalize_resource(post)["title"] == "A post"
+    assert harvest.normalize_resource({"resource_type": "blog", "title": "No link"}) is None
+
+
+def test_harvest_upserts_recorded_responses_once_per_url(run_with_db):
+    async def test():
+        first = await harvest.harvest(["transformers"])
+        second = await harvest.harvest(["transformers"])  # Same URLs again: updated, not duplicated
+        async with SessionLocal() as db:
+            rows = (await db.execute(models.Resource.__table__.select())).all()
+        return first, second, rows
+
+    first, second, rows = run_with_db(test)
+
+    assert first == second == 3 + 2 + 2
+    assert len(rows) == 7
+    assert {row.resource_type for row in rows} == {"github", "arxiv paper", "blog"}
+    repo = next(row for row in rows if row.url == "https://github.com/huggingface/transformers")
+    assert repo.data["full_name"] == "huggingface/transformers"
+    assert repo.data["contributors"] == []
+
+
+def test_upsert_resources_keeps_last_copy_and_updates_existing_rows(run_with_db):
+    url = "https://github.com/lucidrains/x-transformers"
+
+    async def test():
+        async with SessionLocal() as db:
+            await harvest.upsert_resources(db, [{"resource_type": "github", "name": "old", "url": url}])
+            written = await harvest.upsert_resources(db, [
+                {"resource_type": "github", "name": "first copy", "url": url},
+                {"resource_type": "github", "name": "x-transformers", "description": "Attention", "url": url},
+            ])
+            rows = (await db.execute(models.Resource.__table__.select())).all()
+        return written, rows
+
+    written, rows = run_with_db(test)
+
+    assert written == 1
+    assert [(row.title, row.description) for row in rows] == [("x-transformers", "Attention")]
+
+
+def test_local_source_answers_from_harvested_rows(run_with_db):
+    async def test():
+        await harvest.harvest(["transformers"])
+        async with SessionLocal() as db:
+            papers = await main.search_local_resources(db, "image recognition", "arxiv paper", 10)
+            repos = await main.search_local_resources(db, "transformer", "github", 2)
+            next_page = await main.search_local_resources(db, "transformer", "github", 2, page=2)
+        blogs = await main.search_source("blogs", "tabular", 5, 1, include_contributors=False, no_cache=False, local=True)
+        return papers, repos, next_page, blogs
+
+    papers, repos, next_page, blogs = run_with_db(test)
+
+    # Results come back in the live fetchers' shape
+    assert [paper["link"] for paper in papers] == ["http://arxiv.org/abs/2010.11929v2"]
+    assert set(papers[0]) == {"resource_type", "title", "summary", "link", "authors", "published_date"}
+    assert len(repos) == 2 and len(next_page) == 1
+    assert {repo["url"] for repo in repos + next_page} == {
+        "https://github.com/huggingface/transformers",
+        "https://github.com/lucidrains/x-transformers",
+        "https://github.com/harvardnlp/annotated-transformer",
+    }
+    assert [blog["title"] for blog in blogs] == ["Fine-tuning transformers on tabular data?"]
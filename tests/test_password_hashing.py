@@ -0,0 +1,27 @@
+import asyncio
+
+import main
+
+
+def test_hash_password_uses_configured_cost_factor():
+    hashed = main.hash_password("correct horse battery staple")
+
+    assert hashed.startswith(f"$2b${main.BCRYPT_ROUNDS:02d}$")
+    assert main.verify_password("correct horse battery staple", hashed)
+    assert not main.verify_password("wrong", hashed)
+
+
+def test_run_in_password_pool_hashes_off_the_loop_and_updates_stats():
+    before = dict(main.password_pool_stats)
+
+    async def hash_concurrently():
+        return await asyncio.gather(*(main.run_in_password_pool(main.hash_password, f"pw{i}") for i in range(8)))
+
+    hashes = asyncio.run(hash_concurrently())
+
+    assert all(hashed.startswith(f"$2b${main.BCRYPT_ROUNDS:02d}$") for hashed in hashes)
+    assert main.password_pool_stats["submitted"] == before["submitted"] + 8
+    assert main.password_pool_stats["completed"] == before["completed"] + 8
+    assert main.password_pool_stats["running"] == 0
+    assert main.password_queue_depth() == 0
+    assert main.password_pool_stats["max_queue_depth"] >= before["max_queue_depth"]
@@ -0,0 +1,64 @@
+import pytest
+from sqlalchemy import create_engine, insert, select, text
+
+import models
+from database import Base
+
+
+@pytest.fixture(scope="module")
+def connection():
+    """In-memory SQLite with the models' indexes and a few thousand seeded rows."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(insert(models.User), [
+            {"id": user_id, "email": f"user{user_id}@example.com", "hashed_password": "x"} for user_id in range(1, 51)
+        ])
+        conn.execute(insert(models.Bookmark), [
+            {"url": f"https://example.com/{i}", "title": f"Bookmark {i}", "description": "d",
+             "resource_type": "blog", "user_id": i % 50 + 1}
+            for i in range(5000)
+        ])
+        conn.execute(insert(models.CommunityUpload), [
+            {"title": f"Upload {i}", "description": "d", "resource_type": "blog", "url": f"https://example.com/u/{i}",
+             "user_id": i % 50 + 1, "status": "pending_approval" if i % 10 == 0 else "approved"}
+            for i in range(5000)
+        ])
+        conn.execute(text("ANALYZE"))
+    with engine.connect() as conn:
+        yield conn
+
+
+def query_plan(connection, query) -> str:
+    sql = str(query.compile(connection.engine, compile_kwargs={"literal_binds": True}))
+    return " | ".join(row[-1] for row in connection.execute(text(f"EXPLAIN QUERY PLAN {sql}")))
+
+
+def listing_query(model, condition, cursor=100):
+    # Same shape as main.fetch_page: filter, keyset cursor on id, ordered by id, limit + 1
+    return select(model).where(condition).where(model.id > cursor).order_by(model.id).limit(51)
+
+
+def test_bookmark_listing_uses_user_id_id_index(connection):
+    plan = query_plan(connection, listing_query(models.Bookmark, models.Bookmark.user_id == 7))
+
+    assert "USING INDEX ix_bookmarks_user_id_id" in plan
+    assert "TEMP B-TREE" not in plan  # Rows come out of the index already ordered by id
+
+
+def test_approved_uploads_listing_uses_status_id_index(connection):
+    plan = query_plan(connection, listing_query(models.CommunityUpload, models.CommunityUpload.status == "approved"))
+
+    assert "USING INDEX ix_community_uploads_status_id" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def test_pending_uploads_listing_uses_an_index(connection):
+    plan = query_plan(
+        connection, listing_query(models.CommunityUpload, models.CommunityUpload.status == "pending_approval")
+    )
+
+    # Either the partial pending index or the (status, id) index is fine; a table scan isn't
+    assert "SEARCH community_uploads USING INDEX" in plan
+    assert "ix_community_uploads_pending_id" in plan or "ix_community_uploads_status_id" in plan
+    assert "TEMP B-TREE" not in plan
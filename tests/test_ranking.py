@@ -0,0 +1,26 @@
+import pytest
+
+import ranking
+
+
+@pytest.fixture
+def tied_resources():
+    """200 candidates, most of them scoring exactly 0.0 against the query and the rest in tied groups."""
+    topics = ["transformer language models", "language models", "transformer attention", "gardening tips", "cooking"]
+    return [{"title": f"{topics[i % len(topics)]}", "id": i} for i in range(200)]
+
+
+@pytest.mark.parametrize("top_k,offset", [(1, 0), (20, 0), (80, 0), (150, 0), (20, 70), (199, 0)])
+def test_top_k_matches_the_stable_full_sort(tied_resources, top_k, offset):
+    full = ranking.rank_results("transformer language models", tied_resources)
+    page = ranking.rank_results("transformer language models", tied_resources, top_k=top_k, offset=offset)
+
+    assert [r["id"] for r in page] == [r["id"] for r in full[offset:offset + top_k]]
+
+
+def test_full_sort_matches_the_legacy_ranking(tied_resources):
+    legacy = ranking.legacy_rank_results("transformer language models", [dict(r) for r in tied_resources])
+    ranked = ranking.rank_results("transformer language models", tied_resources)
+
+    assert [r["id"] for r in ranked] == [r["id"] for r in legacy]
+    assert sum(r["similarity_score"] == 0 for r in ranked) == 80